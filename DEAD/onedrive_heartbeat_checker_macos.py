@@ -23,14 +23,19 @@ TERMINAL_NOTIFIER    = "/opt/homebrew/bin/terminal-notifier"  # full path requir
 
 # ── HELPERS ───────────────────────────────────────────────────────────────────
 
+_STALE_AFTER = timedelta(minutes=STALE_THRESHOLD)
+
+# Backslashes and double quotes must be escaped inside AppleScript strings
+_APPLE_ESCAPES = str.maketrans({'"': '\\"', '\\': '\\\\'})
+
+
 def is_online() -> bool:
+    # A TCP connect to a public DNS server, in-process: no ping fork/exec,
+    # and no dependency on the ping binary being on the Login Item's PATH
     try:
-        result = subprocess.run(
-            ["ping", "-c", "1", "-W", "3", "8.8.8.8"],
-            capture_output=True, timeout=5
-        )
-        return result.returncode == 0
-    except Exception:
+        with socket.create_connection(("8.8.8.8", 53), timeout=3):
+            return True
+    except OSError:
         return False
 
 
@@ -46,14 +51,20 @@ def notify(title: str, message: str) -> None:
              "-group", str(int(datetime.now(timezone.utc).timestamp()))],
             timeout=5
         )
+    except subprocess.TimeoutExpired:
+        # A hung notifier must not kill the loop; the next check will retry
+        print(f"[{datetime.now(timezone.utc).isoformat()}] terminal-notifier timed out: {title}")
     except FileNotFoundError:
         # Fallback if terminal-notifier not found
-        safe_title = title.replace('"', '\\"')
-        safe_msg   = message.replace('"', '\\"')
-        subprocess.run([
-            "osascript", "-e",
-            f'display notification "{safe_msg}" with title "{safe_title}" sound name "Basso"'
-        ])
+        safe_title = title.translate(_APPLE_ESCAPES)
+        safe_msg   = message.translate(_APPLE_ESCAPES)
+        try:
+            subprocess.run([
+                "osascript", "-e",
+                f'display notification "{safe_msg}" with title "{safe_title}" sound name "Basso"'
+            ], timeout=10)
+        except subprocess.TimeoutExpired:
+            print(f"[{datetime.now(timezone.utc).isoformat()}] osascript timed out: {title}")
 
 
 def check():
@@ -62,12 +73,14 @@ def check():
 
     machine = socket.gethostname()
 
-    if not HEARTBEAT_FILE.exists():
+    # Read directly rather than checking exists() first: one syscall fewer
+    try:
+        raw = HEARTBEAT_FILE.read_text().strip()
+    except FileNotFoundError:
         notify("⚠️ OneDrive Sync Problem",
                f"Heartbeat file not found on {machine}.\nOneDrive may not be syncing.")
         return
 
-    raw = HEARTBEAT_FILE.read_text().strip()
     if not raw:
         notify("⚠️ OneDrive Heartbeat Empty",
                f"Heartbeat file is empty on {machine}.\nServer writer may not be running.")
@@ -84,7 +97,7 @@ def check():
     age      = datetime.now(timezone.utc) - server_time
     age_mins = int(age.total_seconds() / 60)
 
-    if age > timedelta(minutes=STALE_THRESHOLD):
+    if age > _STALE_AFTER:
         notify("⚠️ OneDrive Sync Appears Stuck",
                f"Heartbeat is {age_mins} min old on {machine}.\n"
                f"Last server write: {server_time.strftime('%H:%M:%S')} UTC")
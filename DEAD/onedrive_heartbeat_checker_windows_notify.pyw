@@ -6,7 +6,7 @@ and alerts if it's stale (meaning sync has stopped working).
 Save as .pyw so it runs silently (no console window).
 
 Setup:
-  pip install plyer psutil
+  pip install plyer
 
 Schedule via Task Scheduler every 5 minutes:
   Run setup_checker_windows.ps1  (provided separately)
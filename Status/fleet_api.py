@@ -1,7 +1,7 @@
 # fleet_api.py
 # FLEET_OPS — Fleet status API
 # Serves server_status_all.json and metrics history files to the dashboard
-# Last updated: 2026-06-16 14:12 UTC — add /api/history/<host> endpoint
+# Last updated: 2026-10-15 UTC — cache the parsed status file on its mtime/size
 
 import os
 import json
@@ -60,14 +60,28 @@ def health_check():
     })
 
 
+# Last parsed status file, keyed by its (mtime_ns, size). The checker rewrites
+# the file once per cycle while the dashboard polls far more often, so most
+# requests cost one stat() instead of a read + JSON parse.
+_status_cache = (None, None)
+
+
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """Reads and returns the master status JSON."""
-    if not os.path.exists(STATUS_FILE):
+    global _status_cache
+    try:
+        st = os.stat(STATUS_FILE)
+    except OSError:
         return add_custom_headers({"error": "Status file not found on host"}, 503)
+    key = (st.st_mtime_ns, st.st_size)
+    cached_key, data = _status_cache
+    if cached_key == key:
+        return add_custom_headers(data)
     try:
         with open(STATUS_FILE, 'r') as f:
             data = json.load(f)
+        _status_cache = (key, data)
         return add_custom_headers(data)
     except (json.JSONDecodeError, IOError) as e:
         return add_custom_headers({"error": f"Failed to read status data: {str(e)}"}, 503)
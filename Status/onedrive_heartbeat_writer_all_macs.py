@@ -14,6 +14,7 @@ per-machine copy with a hardcoded HOST constant.
 Created: 2026-06-15 23:00 UTC
 Updated: 2026-06-16 14:12 UTC — add metrics_history append/trim on 30s tick; single loop with counter
 Updated: 2026-07-10 UTC — consolidate mac.py/macMM.py/macMBA2.py into one hostname-aware script
+Updated: 2026-10-15 UTC — write files via temp + rename; schedule ticks on time.monotonic()
 """
 
 import json
@@ -180,10 +181,18 @@ def get_os_build() -> str:
 
 # ── Write functions ────────────────────────────────────────────
 
+def write_text_atomic(path: Path, text: str):
+    """Write to a temp file and rename it over path, so fleet_metrics_server
+    never serves a half-written file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
 def write_heartbeat(output_dir: Path, host: str):
     ts = datetime.now(timezone.utc).isoformat()
     hb_file = output_dir / f"heartbeat_{host}.txt"
-    hb_file.write_text(ts, encoding="utf-8")
+    write_text_atomic(hb_file, ts)
 
 
 def write_machine_info(output_dir: Path, host: str):
@@ -211,7 +220,7 @@ def write_machine_info(output_dir: Path, host: str):
     }
 
     info_file = output_dir / f"machine_info_{host}.json"
-    info_file.write_text(json.dumps(info, indent=4), encoding="utf-8")
+    write_text_atomic(info_file, json.dumps(info, indent=4))
 
 
 def write_history_entry(output_dir: Path, host: str):
@@ -242,7 +251,7 @@ def write_history_entry(output_dir: Path, host: str):
         all_lines = existing + [entry]
         trimmed   = all_lines[-HISTORY_MAX_LINES:]
 
-        history_file.write_text("\n".join(trimmed) + "\n", encoding="utf-8")
+        write_text_atomic(history_file, "\n".join(trimmed) + "\n")
 
     except Exception as e:
         print(f"[{datetime.now(timezone.utc).isoformat()}] history write ERROR: {e}")
@@ -250,6 +259,8 @@ def write_history_entry(output_dir: Path, host: str):
 
 # ── Main loop ──────────────────────────────────────────────────
 # Tick every 30s. Every 5th tick also writes heartbeat + machine_info.
+# Ticks are scheduled on time.monotonic(), so the time spent collecting
+# metrics (top's 1s sample, subprocesses) does not push every later tick back.
 
 def main():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -259,6 +270,7 @@ def main():
     print(f"  History tick: {TICK_SECONDS}s — machine_info every {MACHINE_INFO_EVERY} ticks ({TICK_SECONDS * MACHINE_INFO_EVERY}s)")
 
     tick_count = 0
+    next_tick = time.monotonic()
 
     while True:
         try:
@@ -277,7 +289,13 @@ def main():
             print(f"[{datetime.now(timezone.utc).isoformat()}] ERROR: {e}")
 
         tick_count += 1
-        time.sleep(TICK_SECONDS)
+        next_tick += TICK_SECONDS
+        now = time.monotonic()
+        if next_tick < now:
+            # Fell behind (e.g. the Mac slept): start afresh rather than
+            # firing a burst of catch-up ticks
+            next_tick = now
+        time.sleep(next_tick - now)
 
 
 if __name__ == "__main__":
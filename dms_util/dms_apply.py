@@ -10,7 +10,10 @@ No direct HTML manipulation - just JSON updates + rendering.
 import argparse
 import sys
 import json
+import os
+import shutil
 import subprocess
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 
@@ -37,6 +40,13 @@ def load_approved(pending_path: Path) -> dict:
     
     return json.loads(pending_path.read_text(encoding='utf-8'))
 
+def load_renamed(scan_path: Path) -> list:
+    """Load renamed files detected by the last scan from .dms_scan.json"""
+    if not scan_path.exists():
+        return []
+    
+    return json.loads(scan_path.read_text(encoding='utf-8')).get("renamed_files", [])
+
 def apply_changes(state_path: Path, pending_path: Path, scripts_dir: Path) -> int:
     """Apply approved summaries to state and render"""
     
@@ -52,11 +62,23 @@ def apply_changes(state_path: Path, pending_path: Path, scripts_dir: Path) -> in
     approved_data = load_approved(pending_path)
     approved = approved_data.get("summaries", [])
     
-    if not approved:
+    # Renames detected by scan need no summary: the entry just moves key
+    renamed = load_renamed(doc_dir / ".dms_scan.json")
+    
+    if not approved and not renamed:
         print("No approved summaries found.")
         return 0
     
-    print(f"Applying {len(approved)} approved summary/summaries...\n")
+    for rename in renamed:
+        doc_entry = state['documents'].pop(rename['old_path'], None)
+        if doc_entry is not None:
+            state['documents'][rename['path']] = doc_entry
+            print(f"  → {rename['old_path']} -> {rename['path']}")
+    if renamed:
+        print(f"Applied {len(renamed)} rename(s)\n")
+    
+    if approved:
+        print(f"Applying {len(approved)} approved summary/summaries...\n")
     
     # Group by category for reporting
     by_category = {}
@@ -88,6 +110,16 @@ def apply_changes(state_path: Path, pending_path: Path, scripts_dir: Path) -> in
             if full_path.exists():
                 doc_entry['file_mtime'] = get_file_mtime_iso(full_path)
         
+        # Record the size and mtime the hash was taken at, so the next scan
+        # can skip re-hashing the file while they still match
+        if 'file_mtime_ns' in summary_info['file']:
+            doc_entry['size'] = summary_info['file'].get('size', 0)
+            doc_entry['file_mtime_ns'] = summary_info['file']['file_mtime_ns']
+            # Inode identity lets the next scan recognise a rename or move
+            if summary_info['file'].get('ino'):
+                doc_entry['dev'] = summary_info['file'].get('dev')
+                doc_entry['ino'] = summary_info['file']['ino']
+        
         # Include readable version link if provided
         if summary_info['file'].get('readable_version'):
             doc_entry['readable_version'] = summary_info['file']['readable_version']
@@ -100,37 +132,39 @@ def apply_changes(state_path: Path, pending_path: Path, scripts_dir: Path) -> in
     
     # Report
     print("Applied to categories:")
-    for category, count in sorted(by_category.items()):
+    for category, count in sorted(by_category.items(), key=itemgetter(0)):
         print(f"  + {count} file(s) → {category}")
     
     # Update metadata
     state['metadata']['last_apply'] = datetime.now().isoformat()
     
-    # Save updated state (with backup)
+    # Save updated state (with backup). The new state goes to a temp file and
+    # the old one is hard-linked as .backup rather than read back and copied,
+    # so a large state file is written once instead of read + written twice.
+    # The temp file is then renamed over the state, so the state path always
+    # names a complete file.
     backup_path = state_path.parent / f"{state_path.name}.backup"
+    tmp_path = state_path.parent / f"{state_path.name}.tmp"
+    tmp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
     if state_path.exists():
-        backup_path.write_text(state_path.read_text(encoding='utf-8'))
-    
-    state_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        backup_path.unlink(missing_ok=True)
+        try:
+            os.link(state_path, backup_path)
+        except OSError:
+            # No hard links on this filesystem
+            shutil.copy2(state_path, backup_path)
+    os.replace(tmp_path, state_path)
     print(f"\n✓ Updated {state_path}")
     
-    # Now render index.html from the new state
-    print(f"\n==> Regenerating index.html from state...\n")
+    # Now render index.html and index_iphone.html from the new state, in
+    # one process so the state is loaded and bucketed once
+    print(f"\n==> Regenerating index.html and index_iphone.html from state...\n")
     
     render_script = scripts_dir / "dms_util" / "dms_render.py"
     result = subprocess.run(
         [sys.executable, str(render_script), 
-         "--doc", str(state_path.parent)],
-        capture_output=False
-    )
-    
-    # Now render index_iphone.html from the new state
-    print(f"\n==> Regenerating index_iphone.html from state...\n")
-    
-    render_script = scripts_dir / "dms_util" / "dms_render_iphone.py"
-    result = subprocess.run(
-        [sys.executable, str(render_script), 
-         "--doc", str(state_path.parent)],
+         "--doc", str(state_path.parent),
+         "--iphone-index", "Doc/index_iphone.html"],
         capture_output=False
     )
     
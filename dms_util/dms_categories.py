@@ -16,9 +16,10 @@ Usage:
   python3 dms_categories.py --doc Doc rename "OldName" "NewName"
   python3 dms_categories.py --doc Doc delete "OldName"
 """
-import argparse
 import sys
 import json
+import os
+from collections import Counter
 from pathlib import Path
 
 def load_state(state_path: Path) -> dict:
@@ -29,8 +30,10 @@ def load_state(state_path: Path) -> dict:
     return json.loads(state_path.read_text(encoding='utf-8'))
 
 def save_state(state_path: Path, state: dict) -> None:
-    """Save .dms_state.json"""
-    state_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+    """Save .dms_state.json (temp file + rename, so a crash never leaves it half-written)"""
+    tmp_path = state_path.with_suffix('.json.tmp')
+    tmp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+    os.replace(tmp_path, state_path)
 
 def cmd_list(state: dict, state_path: Path) -> int:
     """List all categories and file counts"""
@@ -39,18 +42,18 @@ def cmd_list(state: dict, state_path: Path) -> int:
     
     print("\n=== CATEGORIES ===\n")
     
+    # One pass over documents gives every category's count
+    counts = Counter(d.get('category') for d in documents.values())
+    
     for cat in categories:
-        count = sum(1 for d in documents.values() if d.get('category') == cat)
-        print(f"  {cat}: {count} file(s)")
+        print(f"  {cat}: {counts.get(cat, 0)} file(s)")
     
     # Show orphaned files (using categories not in list)
-    used_cats = set(d.get('category') for d in documents.values())
-    orphaned = used_cats - set(categories)
+    orphaned = counts.keys() - set(categories)
     if orphaned:
         print("\n  ⚠ Orphaned (not in category list):")
         for cat in orphaned:
-            count = sum(1 for d in documents.values() if d.get('category') == cat)
-            print(f"    {cat}: {count} file(s)")
+            print(f"    {cat}: {counts[cat]} file(s)")
     
     print()
     return 0
@@ -145,7 +148,30 @@ def cmd_delete(state: dict, state_path: Path, name: str) -> int:
     print(f"  Moved {moved} document(s) to Junk")
     return 0
 
-def main():
+# command -> (handler, number of positional args)
+HANDLERS = {
+    "list": (cmd_list, 0),
+    "add": (cmd_add, 1),
+    "move": (cmd_move, 2),
+    "rename": (cmd_rename, 2),
+    "delete": (cmd_delete, 1),
+}
+
+def parse_fast(argv: list) -> tuple | None:
+    """Hand-parse '[--doc X] <cmd> [args...]'; None means fall back to argparse"""
+    doc = "Doc"
+    if len(argv) >= 2 and argv[0] == "--doc":
+        doc, argv = argv[1], argv[2:]
+    if not argv or argv[0] not in HANDLERS:
+        return None
+    command, rest = argv[0], argv[1:]
+    if len(rest) != HANDLERS[command][1] or any(a.startswith("-") for a in rest):
+        return None
+    return doc, command, rest
+
+def parse_args(argv: list) -> tuple:
+    """Full argparse parse, only used for help and malformed command lines"""
+    import argparse
     parser = argparse.ArgumentParser(description="Manage DMS categories")
     parser.add_argument("--doc", default="Doc", help="Doc directory")
     subparsers = parser.add_subparsers(dest="command", help="Command")
@@ -163,13 +189,30 @@ def main():
     
     subparsers.add_parser("delete", help="Delete category").add_argument("name")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
+        return args.doc, None, []
+    
+    positional = {
+        "list": [],
+        "add": [getattr(args, "name", None)],
+        "move": [getattr(args, "file", None), getattr(args, "category", None)],
+        "rename": [getattr(args, "old", None), getattr(args, "new", None)],
+        "delete": [getattr(args, "name", None)],
+    }
+    return args.doc, args.command, positional[args.command]
+
+def main():
+    argv = sys.argv[1:]
+    parsed = parse_fast(argv) or parse_args(argv)
+    doc, command, rest = parsed
+    
+    if not command:
         return 0
     
-    doc_dir = Path(args.doc)
+    doc_dir = Path(doc)
     state_path = doc_dir / ".dms_state.json"
     
     if not doc_dir.exists():
@@ -178,18 +221,8 @@ def main():
     
     state = load_state(state_path)
     
-    if args.command == "list":
-        return cmd_list(state, state_path)
-    elif args.command == "add":
-        return cmd_add(state, state_path, args.name)
-    elif args.command == "move":
-        return cmd_move(state, state_path, args.file, args.category)
-    elif args.command == "rename":
-        return cmd_rename(state, state_path, args.old, args.new)
-    elif args.command == "delete":
-        return cmd_delete(state, state_path, args.name)
-    
-    return 0
+    handler = HANDLERS[command][0]
+    return handler(state, state_path, *rest)
 
 if __name__ == "__main__":
     sys.exit(main())
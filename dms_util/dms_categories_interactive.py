@@ -20,8 +20,16 @@ Non-interactive (command line):
 import argparse
 import sys
 import json
+import os
+from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson  # Optional: parses bytes directly, several times faster than json
+except ImportError:
+    orjson = None
+
 def load_state(state_path: Path) -> dict:
     """Load .dms_state.json"""
     if not state_path.exists():
@@ -29,57 +37,87 @@ def load_state(state_path: Path) -> dict:
         return None
     
     try:
+        if orjson is not None:
+            return orjson.loads(state_path.read_bytes())
         return json.loads(state_path.read_text(encoding='utf-8'))
     except Exception as e:
         print(f"ERROR: Failed to load state: {e}", file=sys.stderr)
         return None
 
 def save_state(state_path: Path, state: dict) -> None:
-    """Save .dms_state.json"""
-    state_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+    """Save .dms_state.json (temp file + rename, so a crash never leaves it half-written)"""
+    tmp_path = state_path.with_suffix('.json.tmp')
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+    else:
+        tmp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+    os.replace(tmp_path, state_path)
+
+def ask(prompt: str) -> str:
+    """Prompt and read one line without going through input()/readline.
+
+    Used for menu numbers and y/N confirmations; free-form category names
+    still use input() so line editing works there.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+def group_by_category(documents: dict) -> dict:
+    """Group (path, doc) pairs by category in a single pass over documents"""
+    by_cat = defaultdict(list)
+    for path, doc in documents.items():
+        by_cat[doc.get('category')].append((path, doc))
+    return by_cat
 
-def list_categories(state: dict):
+def list_categories(state: dict, by_cat: dict = None):
     """List all categories with file counts and files"""
     categories = state.get('categories', [])
-    documents = state.get('documents', {})
+    if by_cat is None:
+        by_cat = group_by_category(state.get('documents', {}))
     
     if not categories:
         print("No categories defined.")
         return
     
-    print(f"\n{'='*70}")
-    print(f"CATEGORIES ({len(categories)} total)")
-    print('='*70)
+    # Build the whole listing and write it once
+    lines = [f"\n{'='*70}", f"CATEGORIES ({len(categories)} total)", '='*70]
     
     for cat in categories:
-        docs_in_cat = [d for d in documents.values() if d.get('category') == cat]
-        print(f"\n📁 {cat}: {len(docs_in_cat)} file(s)")
+        docs_in_cat = [d for _, d in by_cat.get(cat, ())]
+        lines.append(f"\n📁 {cat}: {len(docs_in_cat)} file(s)")
         
         if docs_in_cat:
             for doc_info in sorted(docs_in_cat, key=lambda x: x.get('title', ''))[:5]:
                 title = doc_info.get('title', 'Untitled')
-                print(f"   • {title}")
+                lines.append(f"   • {title}")
             
             if len(docs_in_cat) > 5:
-                print(f"   ... and {len(docs_in_cat) - 5} more")
+                lines.append(f"   ... and {len(docs_in_cat) - 5} more")
     
-    print()
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
 
-def list_files_for_category(state: dict):
+def list_files_for_category(state: dict, by_cat: dict = None):
     """Show files in a category with options to move one or multiple"""
     categories = state.get('categories', [])
     documents = state.get('documents', {})
+    if by_cat is None:
+        by_cat = group_by_category(documents)
     
     print("\nSelect category to view files:")
     for i, cat in enumerate(categories, 1):
-        count = sum(1 for d in documents.values() if d.get('category') == cat)
-        print(f"  {i}. {cat} ({count} files)")
+        print(f"  {i}. {cat} ({len(by_cat.get(cat, ()))} files)")
     
     try:
-        choice = int(input("\nEnter number: ").strip())
+        choice = int(ask("\nEnter number: ").strip())
         if 1 <= choice <= len(categories):
             selected_cat = categories[choice - 1]
-            docs_in_cat = [(p, d) for p, d in documents.items() if d.get('category') == selected_cat]
+            # Sorted once; the listing, single pick and multi-select all index into it
+            docs_in_cat = sorted(by_cat.get(selected_cat, ()), key=itemgetter(0))
             
             if not docs_in_cat:
                 print(f"\nNo files in '{selected_cat}'")
@@ -89,7 +127,7 @@ def list_files_for_category(state: dict):
             print(f"Files in '{selected_cat}' ({len(docs_in_cat)} total)")
             print('='*70)
             
-            for i, (path, doc) in enumerate(sorted(docs_in_cat), 1):
+            for i, (path, doc) in enumerate(docs_in_cat, 1):
                 title = doc.get('title', path)
                 summary = doc.get('summary', '')[:50]
                 print(f"  {i:2d}. {title}")
@@ -102,14 +140,14 @@ def list_files_for_category(state: dict):
             print("  3. Move all files in this category")
             print("  4. Back to menu")
             
-            action = input("\nSelect option (1-4): ").strip()
+            action = ask("\nSelect option (1-4): ").strip()
             
             if action == "1":
                 # Single file
                 try:
-                    file_num = int(input(f"\nEnter file number (1-{len(docs_in_cat)}): ").strip())
+                    file_num = int(ask(f"\nEnter file number (1-{len(docs_in_cat)}): ").strip())
                     if 1 <= file_num <= len(docs_in_cat):
-                        file_path = sorted(docs_in_cat)[file_num - 1][0]
+                        file_path = docs_in_cat[file_num - 1][0]
                         return move_file_to_category(documents, categories, file_path, selected_cat)
                 except ValueError:
                     print("Invalid input")
@@ -120,11 +158,11 @@ def list_files_for_category(state: dict):
                 print("Or 'all' to move all, or 'none' to cancel\n")
                 
                 # Show numbered list with checkboxes
-                for i, (path, doc) in enumerate(sorted(docs_in_cat), 1):
+                for i, (path, doc) in enumerate(docs_in_cat, 1):
                     title = doc.get('title', path)
                     print(f"  [ ] {i}. {title}")
                 
-                selection = input("\nEnter selection: ").strip().lower()
+                selection = ask("\nEnter selection: ").strip().lower()
                 
                 if selection == 'none' or selection == '':
                     return False
@@ -135,8 +173,7 @@ def list_files_for_category(state: dict):
                     # Parse comma-separated numbers
                     try:
                         indices = [int(x.strip()) - 1 for x in selection.split(',')]
-                        sorted_docs = sorted(docs_in_cat)
-                        matching = [sorted_docs[i][0] for i in indices if 0 <= i < len(sorted_docs)]
+                        matching = [docs_in_cat[i][0] for i in indices if 0 <= i < len(docs_in_cat)]
                     except ValueError:
                         print("Invalid selection format")
                         return False
@@ -149,7 +186,7 @@ def list_files_for_category(state: dict):
                 for p in matching:
                     print(f"  • {documents[p].get('title', p)}")
                 
-                confirm = input(f"\nMove all {len(matching)} files to different category? [y/N]: ").strip().lower()
+                confirm = ask(f"\nMove all {len(matching)} files to different category? [y/N]: ").strip().lower()
                 if confirm == 'y':
                     print("\nSelect target category:")
                     for i, cat in enumerate(categories, 1):
@@ -157,7 +194,7 @@ def list_files_for_category(state: dict):
                         print(f"  {i}. {cat}{marker}")
                     
                     try:
-                        target_num = int(input("\nEnter number: ").strip())
+                        target_num = int(ask("\nEnter number: ").strip())
                         if 1 <= target_num <= len(categories):
                             target_cat = categories[target_num - 1]
                             moved = 0
@@ -183,7 +220,7 @@ def list_files_for_category(state: dict):
                     print(f"  {i}. {cat}{marker}")
                 
                 try:
-                    target_num = int(input("\nEnter number: ").strip())
+                    target_num = int(ask("\nEnter number: ").strip())
                     if 1 <= target_num <= len(categories):
                         target_cat = categories[target_num - 1]
                         
@@ -191,7 +228,7 @@ def list_files_for_category(state: dict):
                             print("Files already in that category.")
                             return False
                         
-                        confirm = input(f"\nMove all {len(docs_in_cat)} files to '{target_cat}'? [y/N]: ").strip().lower()
+                        confirm = ask(f"\nMove all {len(docs_in_cat)} files to '{target_cat}'? [y/N]: ").strip().lower()
                         if confirm == 'y':
                             for file_path, _ in docs_in_cat:
                                 documents[file_path]['category'] = target_cat
@@ -216,7 +253,7 @@ def move_file_to_category(documents: dict, categories: list, file_path: str, sou
         print(f"  {i}. {cat}{marker}")
     
     try:
-        target_num = int(input("\nEnter number: ").strip())
+        target_num = int(ask("\nEnter number: ").strip())
         if 1 <= target_num <= len(categories):
             target_cat = categories[target_num - 1]
             old_cat = documents[file_path].get('category')
@@ -229,18 +266,37 @@ def move_file_to_category(documents: dict, categories: list, file_path: str, sou
     
     return False
 
+# Shown before asking for a new or renamed category name
+NAMING_TIPS = "\n".join([
+    "",
+    "-"*70,
+    "💡 NAMING TIPS:",
+    "-"*70,
+    "Avoid names too similar to existing ones - this can confuse the AI.",
+    "\nGood examples for archival/legacy categories:",
+    "  • Archived-Workflows",
+    "  • Legacy-Workflows",
+    "  • Old-Workflows",
+    "  • Workflows-Archive",
+    "\nBad examples (too similar):",
+    "  ✗ Workflow (similar to 'Workflows')",
+    "  ✗ Workflows - old (ambiguous)",
+    "="*70 + "\n",
+    "",
+])
+
 def check_similar_names(name: str, categories: list) -> str:
     """Check for dangerously similar category names"""
-    name_lower = name.lower()
+    name_folded = name.casefold()
     
     for existing in categories:
-        existing_lower = existing.lower()
+        existing_folded = existing.casefold()
+        if existing_folded == name_folded:  # Identical, not just similar
+            continue
         
-        # Check if one contains the other
-        if name_lower in existing_lower or existing_lower in name_lower:
-            # They share significant text
-            if name_lower != existing_lower:  # But not identical
-                return f"⚠ WARNING: Similar to existing category '{existing}'\n  This could confuse the AI when suggesting categories.\n  Consider a more distinct name."
+        # Check if one contains the other - they share significant text
+        if name_folded in existing_folded or existing_folded in name_folded:
+            return f"⚠ WARNING: Similar to existing category '{existing}'\n  This could confuse the AI when suggesting categories.\n  Consider a more distinct name."
     
     return None
 
@@ -255,19 +311,7 @@ def add_category(state: dict):
     for cat in categories:
         print(f"  • {cat}")
     
-    print("\n" + "-"*70)
-    print("💡 NAMING TIPS:")
-    print("-"*70)
-    print("Avoid names too similar to existing ones - this can confuse the AI.")
-    print("\nGood examples for archival/legacy categories:")
-    print("  • Archived-Workflows")
-    print("  • Legacy-Workflows")
-    print("  • Old-Workflows")
-    print("  • Workflows-Archive")
-    print("\nBad examples (too similar):")
-    print("  ✗ Workflow (similar to 'Workflows')")
-    print("  ✗ Workflows - old (ambiguous)")
-    print("="*70 + "\n")
+    sys.stdout.write(NAMING_TIPS)
     
     name = input("Enter new category name: ").strip()
     
@@ -283,7 +327,7 @@ def add_category(state: dict):
     warning = check_similar_names(name, categories)
     if warning:
         print(f"\n{warning}")
-        confirm = input("\nAdd anyway? [y/N]: ").strip().lower()
+        confirm = ask("\nAdd anyway? [y/N]: ").strip().lower()
         if confirm != 'y':
             print("Cancelled.")
             return False
@@ -292,10 +336,12 @@ def add_category(state: dict):
     print(f"✓ Added category: {name}")
     return True
 
-def rename_category(state: dict):
+def rename_category(state: dict, by_cat: dict = None):
     """Rename category interactively"""
     categories = state.get('categories', [])
     documents = state.get('documents', {})
+    if by_cat is None:
+        by_cat = group_by_category(documents)
     
     print("\n" + "="*70)
     print("RENAME CATEGORY")
@@ -303,27 +349,14 @@ def rename_category(state: dict):
     
     print("\nSelect category to rename:")
     for i, cat in enumerate(categories, 1):
-        count = sum(1 for d in documents.values() if d.get('category') == cat)
-        print(f"  {i}. {cat} ({count} files)")
+        print(f"  {i}. {cat} ({len(by_cat.get(cat, ()))} files)")
     
     try:
-        choice = int(input("\nEnter number: ").strip())
+        choice = int(ask("\nEnter number: ").strip())
         if 1 <= choice <= len(categories):
             old_name = categories[choice - 1]
             
-            print("\n" + "-"*70)
-            print("💡 NAMING TIPS:")
-            print("-"*70)
-            print("Avoid names too similar to existing ones - this can confuse the AI.")
-            print("\nGood examples for archival/legacy categories:")
-            print("  • Archived-Workflows")
-            print("  • Legacy-Workflows")
-            print("  • Old-Workflows")
-            print("  • Workflows-Archive")
-            print("\nBad examples (too similar):")
-            print("  ✗ Workflow (similar to 'Workflows')")
-            print("  ✗ Workflows - old (ambiguous)")
-            print("="*70 + "\n")
+            sys.stdout.write(NAMING_TIPS)
             
             new_name = input(f"New name for '{old_name}': ").strip()
             
@@ -339,7 +372,7 @@ def rename_category(state: dict):
             warning = check_similar_names(new_name, categories)
             if warning:
                 print(f"\n{warning}")
-                confirm = input("\nRename anyway? [y/N]: ").strip().lower()
+                confirm = ask("\nRename anyway? [y/N]: ").strip().lower()
                 if confirm != 'y':
                     print("Cancelled.")
                     return False
@@ -347,12 +380,11 @@ def rename_category(state: dict):
             # Update categories list
             categories[choice - 1] = new_name
             
-            # Update all documents
+            # Update all documents - only the renamed category's bucket
             updated = 0
-            for doc_data in documents.values():
-                if doc_data.get('category') == old_name:
-                    doc_data['category'] = new_name
-                    updated += 1
+            for _, doc_data in by_cat.get(old_name, ()):
+                doc_data['category'] = new_name
+                updated += 1
             
             print(f"\n✓ Renamed: {old_name} → {new_name}")
             print(f"  Updated {updated} file(s)")
@@ -364,10 +396,12 @@ def rename_category(state: dict):
     
     return False
 
-def delete_category(state: dict):
+def delete_category(state: dict, by_cat: dict = None):
     """Delete category interactively"""
     categories = state.get('categories', [])
     documents = state.get('documents', {})
+    if by_cat is None:
+        by_cat = group_by_category(documents)
     
     print("\n" + "="*70)
     print("DELETE CATEGORY")
@@ -375,24 +409,22 @@ def delete_category(state: dict):
     
     print("\nSelect category to delete:")
     for i, cat in enumerate(categories, 1):
-        count = sum(1 for d in documents.values() if d.get('category') == cat)
-        print(f"  {i}. {cat} ({count} files)")
+        print(f"  {i}. {cat} ({len(by_cat.get(cat, ()))} files)")
     
     try:
-        choice = int(input("\nEnter number: ").strip())
+        choice = int(ask("\nEnter number: ").strip())
         if 1 <= choice <= len(categories):
             name = categories[choice - 1]
-            docs_in_cat = sum(1 for d in documents.values() if d.get('category') == name)
+            docs_in_cat = len(by_cat.get(name, ()))
             
             print(f"\n⚠ WARNING: Deleting '{name}'")
             print(f"  {docs_in_cat} file(s) will be moved to Junk")
             
-            confirm = input(f"\nAre you sure? [y/N]: ").strip().lower()
+            confirm = ask(f"\nAre you sure? [y/N]: ").strip().lower()
             if confirm == 'y':
-                # Move files to Junk
-                for doc_data in documents.values():
-                    if doc_data.get('category') == name:
-                        doc_data['category'] = 'Junk'
+                # Move files to Junk - only the deleted category's bucket
+                for _, doc_data in by_cat.get(name, ()):
+                    doc_data['category'] = 'Junk'
                 
                 # Remove category
                 categories.remove(name)
@@ -409,49 +441,56 @@ def delete_category(state: dict):
     
     return False
 
+# Whole menu screen, emitted with a single write per redraw
+MENU = "\n".join([
+    "",
+    "="*70,
+    " "*20 + "CATEGORY MANAGER",
+    "="*70,
+    "\nOptions:",
+    "  1. List all categories",
+    "  2. View files in category",
+    "  3. Add new category",
+    "  4. Rename category",
+    "  5. Delete category",
+    "  6. Save and exit",
+    "  7. Exit without saving",
+    "",
+])
+
+# choice -> (handler(state, by_cat) returning True if it changed state,
+#            pause afterwards even when nothing changed)
+MENU_ACTIONS = {
+    "1": (list_categories, True),
+    "2": (list_files_for_category, False),
+    "3": (lambda state, by_cat: add_category(state), True),
+    "4": (rename_category, True),
+    "5": (delete_category, True),
+}
+
 def interactive_menu(state: dict, state_path: Path) -> int:
     """Interactive category management menu"""
     
     changed = False  # Track changes across all operations
+    by_cat = None    # Documents grouped by category; rebuilt after edits
     
     while True:
-        print("\n" + "="*70)
-        print(" "*20 + "CATEGORY MANAGER")
-        print("="*70)
-        print("\nOptions:")
-        print("  1. List all categories")
-        print("  2. View files in category")
-        print("  3. Add new category")
-        print("  4. Rename category")
-        print("  5. Delete category")
-        print("  6. Save and exit")
-        print("  7. Exit without saving")
+        if by_cat is None:
+            by_cat = group_by_category(state.get('documents', {}))
         
-        choice = input("\nEnter choice (1-7): ").strip()
+        sys.stdout.write(MENU)
         
-        if choice == "1":
-            list_categories(state)
-            input("Press Enter to continue...")
-        
-        elif choice == "2":
-            if list_files_for_category(state):
-                changed = True
-                input("\nPress Enter to continue...")
-        
-        elif choice == "3":
-            if add_category(state):
-                changed = True
-            input("\nPress Enter to continue...")
-        
-        elif choice == "4":
-            if rename_category(state):
-                changed = True
-            input("\nPress Enter to continue...")
+        choice = ask("\nEnter choice (1-7): ").strip()
         
-        elif choice == "5":
-            if delete_category(state):
+        action = MENU_ACTIONS.get(choice)
+        if action:
+            handler, always_pause = action
+            if handler(state, by_cat):
                 changed = True
-            input("\nPress Enter to continue...")
+                by_cat = None
+            elif not always_pause:
+                continue
+            ask("\nPress Enter to continue...")
         
         elif choice == "6":
             if changed:
@@ -469,7 +508,7 @@ def interactive_menu(state: dict, state_path: Path) -> int:
         
         elif choice == "7":
             if changed:
-                confirm = input("\n⚠ You have unsaved changes. Exit anyway? [y/N]: ").strip().lower()
+                confirm = ask("\n⚠ You have unsaved changes. Exit anyway? [y/N]: ").strip().lower()
                 if confirm != 'y':
                     continue
             print("Goodbye!")
@@ -12,9 +12,17 @@ Usage:
 """
 import argparse
 import json
+import subprocess
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+
+from dms_render_core import DEFAULT_CATEGORIES
+
+try:
+    import orjson  # Optional: parses bytes directly, several times faster than json
+except ImportError:
+    orjson = None
 
 def init_dms(doc_dir: Path) -> int:
     """Initialize DMS for a new Doc/ directory"""
@@ -33,50 +41,53 @@ def init_dms(doc_dir: Path) -> int:
     
     initial_state = {
         "metadata": {
-            "created": datetime.now().isoformat(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             "last_scan": None,
             "last_apply": None
         },
-        "categories": [
-            "Guides",
-            "Workflows",
-            "scripts",
-            "Models",
-            "QuickRefs",
-            "Junk"
-        ],
+        "categories": list(DEFAULT_CATEGORIES),
         "documents": {}
     }
     
-    state_path.write_text(json.dumps(initial_state, indent=2), encoding='utf-8')
+    if orjson is not None:
+        state_path.write_bytes(orjson.dumps(initial_state, option=orjson.OPT_INDENT_2))
+    else:
+        state_path.write_text(json.dumps(initial_state, indent=2), encoding='utf-8')
     print(f"✓ Created {state_path}")
     
     # Generate initial index.html
     index_path = doc_dir / "index.html"
     
-    # Call dms_render to generate from empty state
-    import subprocess
-    from pathlib import Path as PathlibPath
-    
-    # scripts dir is 2 levels up from this file's location
-    scripts_dir = PathlibPath(__file__).parent.parent
-    render_script = scripts_dir / "dms_util" / "dms_render.py"
+    # Render in-process (dms_render sits next to this file, so it is on
+    # sys.path when run as a script); fall back to a subprocess otherwise
+    try:
+        from dms_render import render_index_html
+    except ImportError:
+        render_index_html = None
     
-    if render_script.exists():
-        result = subprocess.run(
-            [sys.executable, str(render_script),
-             "--doc", str(doc_dir),
-             "--index", str(index_path)],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
+    if render_index_html is not None:
+        if render_index_html(state_path, index_path) == 0:
             print(f"✓ Created {index_path}")
         else:
-            print(f"WARNING: Could not render index.html: {result.stderr}", file=sys.stderr)
+            print(f"WARNING: Could not render index.html", file=sys.stderr)
     else:
-        print(f"WARNING: dms_render.py not found, skipping index.html generation", file=sys.stderr)
+        render_script = Path(__file__).parent / "dms_render.py"
+        
+        if render_script.exists():
+            result = subprocess.run(
+                [sys.executable, str(render_script),
+                 "--doc", str(doc_dir),
+                 "--index", str(index_path)],
+                capture_output=True,
+                text=True
+            )
+            
+            if result.returncode == 0:
+                print(f"✓ Created {index_path}")
+            else:
+                print(f"WARNING: Could not render index.html: {result.stderr}", file=sys.stderr)
+        else:
+            print(f"WARNING: dms_render.py not found, skipping index.html generation", file=sys.stderr)
     
     print(f"\n✓ DMS initialized!")
     print(f"\nNext steps:")
@@ -16,6 +16,12 @@ def run_cmd(cmd_list, description=""):
     result = subprocess.run(cmd_list)
     return result.returncode
 
+def pause(prompt="Press Enter to continue..."):
+    """Wait for Enter; return any command typed at the prompt instead"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip().lower()
+
 def check_system():
     """Run system diagnostics"""
     print("\n" + "="*70)
@@ -187,16 +193,21 @@ FILES TRACKED:
   .dms_scan.json               - Last scan results (new/changed/missing)
   .dms_pending_summaries.json  - Pending AI summaries
   .dms_pending_approved.json   - Approved summaries waiting to be applied
+  .dms_summary_cache.json      - Cached AI results, reused for unchanged content
   index.html                   - Generated HTML index with all documents
 """)
     print("="*70 + "\n")
 
 def main():
     """Main menu loop"""
+    pending = ""
     while True:
-        show_menu()
-        
-        choice = input("\nEnter command or number: ").strip().lower()
+        if pending:
+            # Command typed at the pause prompt - run it without a redraw
+            choice, pending = pending, ""
+        else:
+            show_menu()
+            choice = input("\nEnter command or number: ").strip().lower()
         
         if choice in ['q', 'quit', 'exit']:
             print("\nGoodbye!")
@@ -207,33 +218,33 @@ def main():
         
         elif choice in ['h', 'help']:
             show_help()
-            input("Press Enter to continue...")
+            pending = pause()
         
         # Standard workflow by number
         elif choice in ['1', 'scan']:
             run_cmd(['dms', 'scan'], "Scan for new/changed files")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice in ['2', 'image-to-text']:
             run_cmd(['dms', 'image-to-text'], "Convert images to text")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice in ['3', 'summarize']:
             run_cmd(['dms', 'summarize'], "Generate AI summaries")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice in ['4', 'review']:
             run_cmd(['dms', 'review'], "Interactive review of changes")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice in ['5', 'apply']:
             run_cmd(['dms', 'apply'], "Apply approved changes to index.html")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         # Diagnostic
         elif choice in ['6', 'c']:
             check_system()
-            input("Press Enter to continue...")
+            pending = pause()
         
         elif choice in ['7', 'l']:
             print("\n" + "="*60)
@@ -242,12 +253,12 @@ def main():
             print("(Log viewing not yet implemented)")
             print("Check Doc/ for .dms_*.json files for latest state\n")
             print("="*60 + "\n")
-            input("Press Enter to continue...")
+            pending = pause()
         
         # Setup new DMS
         elif choice in ['8', 'i']:
             run_cmd(['dms', 'init'], "Initialize new DMS")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice in ['9', 's']:
             print("\n" + "="*60)
@@ -268,20 +279,20 @@ Common models:
 Current config: Scripts/dms_config.json
 """)
             print("="*60 + "\n")
-            input("Press Enter to continue...")
+            pending = pause()
         
         # Aux commands
         elif choice in ['o']:
             run_cmd(['dms', 'image-to-text'], "Convert images to text (OCR)")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice in ['x']:
             run_cmd(['dms', 'cleanup'], "Cleanup missing files from state")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice == 'd':
             run_cmd(['dms', 'delete-entry'], "Delete entries from state")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice == 'g':
             show_categories_submenu()
@@ -289,24 +300,24 @@ Current config: Scripts/dms_config.json
         # Full command names
         elif choice == 'status':
             run_cmd(['dms', 'status'], "Show current DMS state")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice == 'cleanup':
             run_cmd(['dms', 'cleanup'], "Cleanup missing files")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice == 'render':
             run_cmd(['dms', 'render'], "Regenerate index.html")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         elif choice == 'delete-entry':
             run_cmd(['dms', 'delete-entry'], "Delete entries from state")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
         
         else:
             print(f"\n✗ Unknown command: {choice}")
             print("Type 'h' for help or 'menu' to refresh")
-            input("\nPress Enter to continue...")
+            pending = pause("\nPress Enter to continue...")
 
 if __name__ == "__main__":
     exit(main())
@@ -9,51 +9,67 @@ Usage:
   python3 dms_render.py --doc Doc --index Doc/index.html
 """
 import argparse
-import json
+import os
 import html as html_module
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 
+from dms_render_core import DEFAULT_CATEGORIES, esc as _esc, is_large_state, iter_file_chunks, load_and_bucket
+
+# The categories dms_init seeds every state with, escaped once at import
+_CATEGORY_ESCAPED = {c: html_module.escape(c) for c in DEFAULT_CATEGORIES}
+
+@lru_cache(maxsize=8192)
 def format_file_mtime(mtime_iso: str) -> str:
     """Format ISO 8601 timestamp for display"""
     if not mtime_iso:
         return ""
+    # Fast path: "YYYY-MM-DDTHH:MM:SS..." already holds the display fields
+    if (len(mtime_iso) >= 19 and mtime_iso[10] in 'T '
+            and mtime_iso[4] == mtime_iso[7] == '-' and mtime_iso[13] == mtime_iso[16] == ':'
+            and (mtime_iso[:4] + mtime_iso[5:7] + mtime_iso[8:10]
+                 + mtime_iso[11:13] + mtime_iso[14:16] + mtime_iso[17:19]).isdigit()):
+        return f"{mtime_iso[:10]} {mtime_iso[11:19]}"
     try:
         dt = datetime.fromisoformat(mtime_iso)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     except:
         return ""
 
-def render_index_html(state_path: Path, index_path: Path):
-    """Generate index.html from .dms_state.json"""
+def render_index_html(state_path: Path, index_path: Path, force: bool = False,
+                      embed_state: bool = False):
+    """Generate index.html from .dms_state.json
+
+    With embed_state, a copy of the state file is included in an HTML
+    comment for debugging; otherwise the page just points at the file.
+    """
     
     # Read state
     if not state_path.exists():
         print(f"ERROR: {state_path} not found")
         return 1
     
-    state = json.loads(state_path.read_text(encoding='utf-8'))
+    # Nothing to do if index.html was written after the last state change
+    if (not force and index_path.exists()
+            and index_path.stat().st_mtime_ns >= state_path.stat().st_mtime_ns):
+        print(f"✓ {index_path} up to date (use --force to re-render)")
+        return 0
     
-    # Group documents by category
-    docs_by_category = {}
-    for category in state.get("categories", []):
-        docs_by_category[category] = []
+    state, docs_by_category = load_and_bucket(state_path)
     
-    for file_path, doc_data in state.get("documents", {}).items():
-        category = doc_data.get("category", "Junk")
-        if category not in docs_by_category:
-            docs_by_category[category] = []
-        docs_by_category[category].append((file_path, doc_data))
+    state_chunks = None
+    if embed_state:
+        # Copy the file into the page as-is rather than re-serializing it
+        if is_large_state(state_path):
+            state_chunks = iter_file_chunks(state_path)
+        else:
+            state_chunks = (state_path.read_bytes().strip(),)
     
-    # Sort documents within each category
-    for category in docs_by_category:
-        docs_by_category[category].sort(key=lambda x: x[1].get("title", x[0]))
-    
-    # Generate HTML
-    html_content = _generate_html(docs_by_category, state)
-    
-    # Write index.html
-    index_path.write_text(html_content, encoding='utf-8')
+    # Generate and write index.html chunk by chunk
+    with index_path.open('wb') as f:
+        f.writelines(_iter_html_bytes(docs_by_category, state, state_chunks))
     
     print(f"✓ Generated {index_path}")
     print(f"  Categories: {len(docs_by_category)}")
@@ -62,26 +78,17 @@ def render_index_html(state_path: Path, index_path: Path):
     
     return 0
 
-def _generate_html(docs_by_category, state):
-    """Generate the complete HTML from state"""
-    
-    # Embed state in HTML for reference (read-only, for debugging)
-    state_json = json.dumps(state, indent=2)
-    
-    categories_html = []
-    for category in state.get("categories", []):
-        docs = docs_by_category.get(category, [])
-        cat_html = _generate_category_section(category, docs)
-        categories_html.append(cat_html)
-    
-    html = f"""<!doctype html>
+# Static page skeleton, built once at import. _iter_html_bytes only fills in
+# the state comment (between HEAD and MID) and the category sections
+# (between MID and TAIL).
+_HTML_HEAD = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width,initial-scale=1" />
   <title>Project Docs Index — Doc/</title>
   <style>
-    :root{{
+    :root{
       --bg:#0f1720;
       --panel:#0b1220;
       --muted:#9aa4b2;
@@ -89,56 +96,56 @@ def _generate_html(docs_by_category, state):
       --accent-2:#7ee787;
       --card:#0f1726;
       --glass: rgba(255,255,255,0.03);
-    }}
-    html,body{{height:100%;margin:0;font-family:Inter,ui-sans-serif,system-ui,-apple-system,Segoe UI,Roboto,"Helvetica Neue",Arial;}}
-    body{{display:flex;flex-direction:column;background:linear-gradient(180deg,#071422 0%, #071522 60%);color:#e6eef6}}
-    header{{padding:18px 20px;border-bottom:1px solid rgba(255,255,255,0.03);display:flex;align-items:center;gap:18px}}
-    header h1{{font-size:18px;margin:0}}
-    header p{{margin:0;color:var(--muted);font-size:13px}}
-    main{{display:flex;flex:1;overflow:hidden}}
+    }
+    html,body{height:100%;margin:0;font-family:Inter,ui-sans-serif,system-ui,-apple-system,Segoe UI,Roboto,"Helvetica Neue",Arial;}
+    body{display:flex;flex-direction:column;background:linear-gradient(180deg,#071422 0%, #071522 60%);color:#e6eef6}
+    header{padding:18px 20px;border-bottom:1px solid rgba(255,255,255,0.03);display:flex;align-items:center;gap:18px}
+    header h1{font-size:18px;margin:0}
+    header p{margin:0;color:var(--muted);font-size:13px}
+    main{display:flex;flex:1;overflow:hidden}
     /* left pane */
-    #sidebar{{width:420px;max-width:46%;min-width:300px;padding:18px;border-right:1px solid rgba(255,255,255,0.03);overflow:auto;background:linear-gradient(180deg, rgba(255,255,255,0.012), rgba(255,255,255,0.008));}}
-    .controls{{display:flex;gap:8px;align-items:center;margin-bottom:14px}}
-    .search{{flex:1;display:flex;align-items:center;background:var(--glass);padding:8px;border-radius:8px}}
-    .search input{{flex:1;border:0;background:transparent;color:inherit;padding:6px 8px;font-size:14px;outline:none}}
-    .search small{{color:var(--muted);font-size:12px;margin-left:6px}}
-    .sort-btn{{padding:8px 12px;background:var(--glass);border:1px solid rgba(255,255,255,0.1);border-radius:8px;color:inherit;cursor:pointer;font-size:13px;white-space:nowrap;transition:background 0.2s}}
-    .sort-btn:hover{{background:rgba(255,255,255,0.08)}}
-    .sort-btn.active{{background:var(--accent);color:#000;font-weight:600}}
-    .category {{margin-top:10px}}
-    .category h2{{margin:6px 0 6px;font-size:13px;color:var(--accent)}}
-    ul.files{{list-style:none;padding:0;margin:0}}
-    li.file{{padding:10px;border-radius:8px;margin:6px 0;display:flex;gap:10px;align-items:flex-start;background:linear-gradient(180deg, rgba(255,255,255,0.008), rgba(255,255,255,0.006));cursor:pointer}}
-    li.file:hover{{box-shadow:0 2px 14px rgba(2,6,23,0.6)}}
-    .file .meta{{flex:1}}
-    .file .title{{color:#dff3ff;font-weight:600;font-size:14px;margin-bottom:4px}}
-    .file .title a{{color:inherit;text-decoration:none}}
-    .file .desc{{font-size:13px;color:var(--muted);line-height:1.3}}
-    .file .tags{{font-size:12px;color:var(--muted);margin-top:6px}}
-    .file .fmt{{font-size:11px;padding:4px 6px;background:rgba(255,255,255,0.02);border-radius:6px;color:var(--muted);margin-left:6px}}
+    #sidebar{width:420px;max-width:46%;min-width:300px;padding:18px;border-right:1px solid rgba(255,255,255,0.03);overflow:auto;background:linear-gradient(180deg, rgba(255,255,255,0.012), rgba(255,255,255,0.008));}
+    .controls{display:flex;gap:8px;align-items:center;margin-bottom:14px}
+    .search{flex:1;display:flex;align-items:center;background:var(--glass);padding:8px;border-radius:8px}
+    .search input{flex:1;border:0;background:transparent;color:inherit;padding:6px 8px;font-size:14px;outline:none}
+    .search small{color:var(--muted);font-size:12px;margin-left:6px}
+    .sort-btn{padding:8px 12px;background:var(--glass);border:1px solid rgba(255,255,255,0.1);border-radius:8px;color:inherit;cursor:pointer;font-size:13px;white-space:nowrap;transition:background 0.2s}
+    .sort-btn:hover{background:rgba(255,255,255,0.08)}
+    .sort-btn.active{background:var(--accent);color:#000;font-weight:600}
+    .category {margin-top:10px}
+    .category h2{margin:6px 0 6px;font-size:13px;color:var(--accent)}
+    ul.files{list-style:none;padding:0;margin:0}
+    li.file{padding:10px;border-radius:8px;margin:6px 0;display:flex;gap:10px;align-items:flex-start;background:linear-gradient(180deg, rgba(255,255,255,0.008), rgba(255,255,255,0.006));cursor:pointer}
+    li.file:hover{box-shadow:0 2px 14px rgba(2,6,23,0.6)}
+    .file .meta{flex:1}
+    .file .title{color:#dff3ff;font-weight:600;font-size:14px;margin-bottom:4px}
+    .file .title a{color:inherit;text-decoration:none}
+    .file .desc{font-size:13px;color:var(--muted);line-height:1.3}
+    .file .tags{font-size:12px;color:var(--muted);margin-top:6px}
+    .file .fmt{font-size:11px;padding:4px 6px;background:rgba(255,255,255,0.02);border-radius:6px;color:var(--muted);margin-left:6px}
 
     /* right pane viewer */
-    #viewer{{flex:1;display:flex;flex-direction:column;min-width:360px}}
-    #viewerHeader{{padding:14px;border-bottom:1px solid rgba(255,255,255,0.03);display:flex;align-items:center;gap:12px}}
-    #viewerHeader h3{{margin:0;font-size:15px}}
-    #viewerBody{{padding:18px;overflow:auto;background:linear-gradient(180deg, rgba(255,255,255,0.006), rgba(255,255,255,0.004));display:flex;flex-direction:column}}
+    #viewer{flex:1;display:flex;flex-direction:column;min-width:360px}
+    #viewerHeader{padding:14px;border-bottom:1px solid rgba(255,255,255,0.03);display:flex;align-items:center;gap:12px}
+    #viewerHeader h3{margin:0;font-size:15px}
+    #viewerBody{padding:18px;overflow:auto;background:linear-gradient(180deg, rgba(255,255,255,0.006), rgba(255,255,255,0.004));display:flex;flex-direction:column}
     /* content area */
-    #content{{max-width:1000px;margin:0 auto;flex:1;display:flex;flex-direction:column;width:100%}}
+    #content{max-width:1000px;margin:0 auto;flex:1;display:flex;flex-direction:column;width:100%}
     /* PDF viewer should take full height */
-    #pdfViewer{{height:80vh !important;}}
+    #pdfViewer{height:80vh !important;}
 
 # Scripts dir is 2 levels up from this file's location
 SCRIPTS_DIR = Path(__file__).parent.parent
 
     /* markdown container */
-    #mdViewer{{background:rgba(255,255,255,0.01);padding:18px;border-radius:8px}}
-    #mdViewer h1,#mdViewer h2,#mdViewer h3{{color:#e8faff}}
-    pre code{{background:#011627;color:#c9dfff;padding:8px;border-radius:6px;display:block;overflow:auto}}
-    a.inline-link{{color:var(--accent);text-decoration:none}}
-    .small-muted{{color:var(--muted);font-size:13px}}
+    #mdViewer{background:rgba(255,255,255,0.01);padding:18px;border-radius:8px}
+    #mdViewer h1,#mdViewer h2,#mdViewer h3{color:#e8faff}
+    pre code{background:#011627;color:#c9dfff;padding:8px;border-radius:6px;display:block;overflow:auto}
+    a.inline-link{color:var(--accent);text-decoration:none}
+    .small-muted{color:var(--muted);font-size:13px}
 
     /* RAW viewer: preserve CR/LF and indentation for text files */
-    #rawViewer{{
+    #rawViewer{
       display:none;
       background:rgba(255,255,255,0.02);
       padding:12px;
@@ -149,22 +156,21 @@ SCRIPTS_DIR = Path(__file__).parent.parent
       word-break: break-word;
       line-height:1.45;
       font-size:13px;
-    }}
+    }
 
     /* responsive */
-    @media(max-width:980px){{
-      #sidebar{{display:block;position:relative;width:100%;max-height:360px;overflow:auto}}
-      #viewer{{min-height:calc(100vh - 360px)}}
-    }}
+    @media(max-width:980px){
+      #sidebar{display:block;position:relative;width:100%;max-height:360px;overflow:auto}
+      #viewer{min-height:calc(100vh - 360px)}
+    }
   </style>
   <!-- marked.js for markdown rendering -->
   <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
 </head>
 <body>
-<!-- DMS_STATE_JSON (read-only, embedded for reference)
-{state_json}
--->
-  <header>
+"""
+
+_HTML_MID = """  <header>
     <h1>📚 Project Docs</h1>
     <p>Organized by category • Searchable • Responsive</p>
   </header>
@@ -179,7 +185,9 @@ SCRIPTS_DIR = Path(__file__).parent.parent
         <button id="sortBtn" class="sort-btn" title="Sort by date (most recent first)">📅 Newest</button>
       </div>
 
-      {"".join(categories_html)}
+      """
+
+_HTML_TAIL = """
     </section>
 
     <section id="viewer">
@@ -207,26 +215,26 @@ SCRIPTS_DIR = Path(__file__).parent.parent
     
     let sortByDate = false;
 
-    function extOf(path) {{
+    function extOf(path) {
       const ext = path.split('.').pop()?.toLowerCase() || '';
       return ext.length <= 5 ? ext : '';
-    }}
+    }
 
-    function safeFetchText(path) {{
+    function safeFetchText(path) {
       return fetch(path).then(r => r.text());
-    }}
+    }
 
-    function openFilePreview(liElement) {{
+    function openFilePreview(liElement) {
       let path, title;
       
       // Handle both element and string path inputs
-      if(typeof liElement === 'string') {{
+      if(typeof liElement === 'string') {
         path = liElement;
         title = path.split('/').pop().split('.')[0];
-      }} else {{
+      } else {
         path = liElement.dataset.path;
         title = liElement.querySelector('.title')?.innerText || 'Document';
-      }}
+      }
       
       const pdf = (liElement.dataset?.pdf || '');
       
@@ -238,231 +246,330 @@ SCRIPTS_DIR = Path(__file__).parent.parent
       const e = extOf(path);
       
       // For DOCX files: show markdown version by default
-      if(e === 'docx' || e === 'doc'){{
+      if(e === 'docx' || e === 'doc'){
         const mdPath = './md_outputs/' + path.split('/').pop().split('.')[0] + '.md';
-        safeFetchText(mdPath).then(txt=>{{
+        safeFetchText(mdPath).then(txt=>{
           mdViewer.innerHTML = marked.parse(txt);
           mdViewer.style.display = 'block';
           const docxInfo = document.createElement('div');
           docxInfo.className = 'small-muted';
           docxInfo.style.marginBottom = '12px';
-          docxInfo.innerHTML = `Source DOCX: <a class="inline-link" href="${{path}}" target="_blank" rel="noopener">📥 Download ${{path}}</a>`;
+          docxInfo.innerHTML = `Source DOCX: <a class="inline-link" href="${path}" target="_blank" rel="noopener">📥 Download ${path}</a>`;
           if(mdViewer.firstChild) mdViewer.insertBefore(docxInfo, mdViewer.firstChild);
           else mdViewer.appendChild(docxInfo);
-        }}).catch(err=>{{
+        }).catch(err=>{
           rawViewer.style.display = 'block';
           rawViewer.innerHTML = `
             <div style="padding: 12px;">
               <p style="margin-top: 0;">DOCX file options:</p>
               <div style="display: flex; gap: 10px; flex-wrap: wrap;">
-                <a href="${{path}}" target="_blank" rel="noopener" style="padding: 8px 12px; background: var(--accent); color: #000; border-radius: 6px; text-decoration: none; font-weight: 500;">📥 Download File</a>
+                <a href="${path}" target="_blank" rel="noopener" style="padding: 8px 12px; background: var(--accent); color: #000; border-radius: 6px; text-decoration: none; font-weight: 500;">📥 Download File</a>
               </div>
               <p style="color: var(--muted); font-size: 13px; margin-top: 12px;">Converted markdown preview not available</p>
             </div>
           `;
-        }});
+        });
         return;
-      }}
+      }
       
-      if(e === 'md' || path.endsWith('.md') || path.includes('md_outputs')){{
-        safeFetchText(path).then(txt=>{{
+      if(e === 'md' || path.endsWith('.md') || path.includes('md_outputs')){
+        safeFetchText(path).then(txt=>{
           mdViewer.innerHTML = marked.parse(txt);
           mdViewer.style.display = 'block';
-          if(pdf){{
+          if(pdf){
             const orig = document.createElement('div');
             orig.className = 'small-muted';
-            orig.innerHTML = `Source PDF: <a class="inline-link" href="${{pdf}}" target="_blank" rel="noopener">${{pdf}}</a>`;
+            orig.innerHTML = `Source PDF: <a class="inline-link" href="${pdf}" target="_blank" rel="noopener">${pdf}</a>`;
             if(mdViewer.firstChild) mdViewer.insertBefore(orig, mdViewer.firstChild);
             else mdViewer.appendChild(orig);
-          }}
-        }}).catch(err=>{{
+          }
+        }).catch(err=>{
           rawViewer.style.display = 'block';
           rawViewer.textContent = 'Failed to load markdown: ' + err;
-        }});
+        });
         return;
-      }}
+      }
       
-      if(e === 'pdf' || pdf.toLowerCase().endsWith('.pdf')){{
+      if(e === 'pdf' || pdf.toLowerCase().endsWith('.pdf')){
         const pdfPath = (e === 'pdf') ? path : pdf;
         pdfViewer.src = pdfPath;
         pdfViewer.style.display = 'block';
         return;
-      }}
+      }
       
       // Handle images
-      if(['png','jpg','jpeg','gif','webp','bmp','svg'].includes(e)){{
+      if(['png','jpg','jpeg','gif','webp','bmp','svg'].includes(e)){
         rawViewer.style.display = 'block';
-        rawViewer.innerHTML = `<img src="${{path}}" style="max-width:100%;max-height:600px;border-radius:8px;" alt="${{title}}">`;
+        rawViewer.innerHTML = `<img src="${path}" style="max-width:100%;max-height:600px;border-radius:8px;" alt="${title}">`;
         return;
-      }}
+      }
       
-      if(['txt','log','out'].includes(e) || e.length<=4){{
-        safeFetchText(path).then(txt=>{{
+      if(['txt','log','out'].includes(e) || e.length<=4){
+        safeFetchText(path).then(txt=>{
           rawViewer.style.display = 'block';
           rawViewer.textContent = txt;
-        }}).catch(err=>{{
+        }).catch(err=>{
           rawViewer.style.display = 'block';
           rawViewer.textContent = 'Failed to load file: ' + err;
-        }});
+        });
         return;
-      }}
+      }
       
       rawViewer.style.display = 'block';
-      rawViewer.innerHTML = `Open file: <a class="inline-link" href="${{path}}" target="_blank" rel="noopener">${{path}}</a>`;
-    }}
+      rawViewer.innerHTML = `Open file: <a class="inline-link" href="${path}" target="_blank" rel="noopener">${path}</a>`;
+    }
 
-    function filterFiles(q){{
+    // The file list is static once the page is loaded, so the entries and
+    // their search text (lowercased title/desc/tags, precomputed into
+    // data-search when the page was rendered) are looked up once.
+    const ALL_FILES = Array.from(document.querySelectorAll('li.file'));
+    const SEARCH_TEXT = ALL_FILES.map(li=>li.dataset.search || '');
+
+    function filterFiles(q){
       q = (q||'').toLowerCase().trim();
-      const files = document.querySelectorAll('li.file');
-      let visible = [];
-      files.forEach(li=>{{
-        const title = li.querySelector('.title').innerText.toLowerCase();
-        const desc = li.querySelector('.desc').innerText.toLowerCase();
-        const tags = li.querySelector('.tags').innerText.toLowerCase();
-        if(!q || title.includes(q) || desc.includes(q) || tags.includes(q)){{
+      let visible = 0;
+      ALL_FILES.forEach((li, i)=>{
+        if(!q || SEARCH_TEXT[i].includes(q)){
           li.style.display = '';
-          visible.push({{el: li, mtime: li.dataset.mtime || ''}});
-        }} else {{
+          visible++;
+        } else {
           li.style.display = 'none';
-        }}
-      }});
-      
-      if(sortByDate){{
-        visible.sort((a,b)=>{{
-          if(!a.mtime || !b.mtime) return 0;
-          return new Date(b.mtime) - new Date(a.mtime);
-        }});
-        
-        visible.forEach(item=>{{
-          item.el.parentElement.appendChild(item.el);
-        }});
-      }}
+        }
+      });
       
-      resultCount.textContent = visible.length ? `${{visible.length}} shown` : 'no results';
-    }}
+      resultCount.textContent = visible ? `${visible} shown` : 'no results';
+    }
+
+    // Newest-first order, computed once on the first toggle. Order only
+    // changes when the sort button is pressed, so filterFiles just shows
+    // and hides entries. ISO 8601 mtimes sort correctly as plain strings.
+    let filesByMtime = null;
+    function sortFilesByDate(){
+      if(!filesByMtime){
+        filesByMtime = ALL_FILES.slice().sort((a,b)=>{
+          const am = a.dataset.mtime || '', bm = b.dataset.mtime || '';
+          if(!am || !bm) return 0;
+          return bm < am ? -1 : bm > am ? 1 : 0;
+        });
+      }
+      filesByMtime.forEach(li=>{
+        li.parentElement.appendChild(li);
+      });
+    }
 
-    searchInput.addEventListener('input', (e)=>{{
-      filterFiles(e.target.value);
-    }});
+    // Coalesce keystrokes: filter 60ms after the last one.
+    let searchTimer;
+    searchInput.addEventListener('input', (e)=>{
+      clearTimeout(searchTimer);
+      searchTimer = setTimeout(()=>filterFiles(e.target.value), 60);
+    });
 
-    sortBtn.addEventListener('click', ()=>{{
+    sortBtn.addEventListener('click', ()=>{
       sortByDate = !sortByDate;
       sortBtn.classList.toggle('active', sortByDate);
       sortBtn.textContent = sortByDate ? '📅 Oldest' : '📅 Newest';
+      if(sortByDate) sortFilesByDate();
       filterFiles(searchInput.value);
-    }});
+    });
 
-    window.addEventListener('load', ()=>{{
+    window.addEventListener('load', ()=>{
       const hash = decodeURIComponent(location.hash.replace(/^#/,''));
-      if(hash){{
-        const el = Array.from(document.querySelectorAll('li.file')).find(li=>{{
+      if(hash){
+        const el = Array.from(document.querySelectorAll('li.file')).find(li=>{
           return li.dataset.path===hash || li.dataset.pdf===hash || li.querySelector('.title').innerText===hash;
-        }});
+        });
         if(el) openFilePreview(el);
         else if(hash) openFilePreview(hash);  // If no li found, try opening the path directly
-      }}
+      }
       filterFiles('');
-    }});
+    });
 
     // Handle hash changes (when clicking image/file links)
-    window.addEventListener('hashchange', ()=>{{
+    window.addEventListener('hashchange', ()=>{
       const hash = decodeURIComponent(location.hash.replace(/^#/,''));
-      if(hash){{
-        const el = Array.from(document.querySelectorAll('li.file')).find(li=>{{
+      if(hash){
+        const el = Array.from(document.querySelectorAll('li.file')).find(li=>{
           return li.dataset.path===hash || li.dataset.pdf===hash || li.querySelector('.title').innerText===hash;
-        }});
+        });
         if(el) openFilePreview(el);
         else if(hash) openFilePreview(hash);  // If no li found, try opening the path directly
-      }}
-    }});
+      }
+    });
 
-    window.addEventListener('keydown', (e)=>{{
-      if(e.key==='/' && document.activeElement !== searchInput){{
+    window.addEventListener('keydown', (e)=>{
+      if(e.key==='/' && document.activeElement !== searchInput){
         e.preventDefault();
         searchInput.focus();
         searchInput.select();
-      }}
-    }});
+      }
+    });
 
     // Attach click handler to all file entries
-    document.addEventListener('click', (e)=>{{
+    document.addEventListener('click', (e)=>{
       const li = e.target.closest('li.file');
       if(li) openFilePreview(li);
-    }});
+    });
   </script>
 </body>
 </html>"""
+
+_HTML_HEAD_BYTES = _HTML_HEAD.encode('utf-8')
+_STATE_REF_BYTES = b"<!-- state at .dms_state.json -->\n"
+_STATE_EMBED_OPEN_BYTES = b"<!-- DMS_STATE_JSON (read-only, embedded for reference)\n"
+_STATE_EMBED_CLOSE_BYTES = b"\n-->\n"
+_HTML_MID_BYTES = _HTML_MID.encode('utf-8')
+_HTML_TAIL_BYTES = _HTML_TAIL.encode('utf-8')
+
+def _iter_html_bytes(docs_by_category, state, state_chunks):
+    """Yield the complete HTML as UTF-8 chunks, without building one big string
+
+    state_chunks is the state file's own bytes (one or more chunks), which
+    are embedded as-is instead of re-serializing the parsed state, or None
+    to leave the state out of the page.
+    """
     
-    return html
+    yield _HTML_HEAD_BYTES
+    if state_chunks is None:
+        yield _STATE_REF_BYTES
+    else:
+        # Embed state in HTML for reference (read-only, for debugging)
+        yield _STATE_EMBED_OPEN_BYTES
+        yield from state_chunks
+        yield _STATE_EMBED_CLOSE_BYTES
+    yield _HTML_MID_BYTES
+    
+    for category in state.get("categories", []):
+        docs = docs_by_category.get(category, [])
+        yield _generate_category_section(category, docs)
+    
+    yield _HTML_TAIL_BYTES
+
+# Readable-version extension -> (icon, label) for the "view converted" link
+_READABLE_LINKS = {
+    '.png': ("🖼️", "View Image"),
+    '.jpg': ("🖼️", "View Image"),
+    '.jpeg': ("🖼️", "View Image"),
+    '.gif': ("🖼️", "View Image"),
+    '.webp': ("🖼️", "View Image"),
+    '.md': ("📄", "View Markdown"),
+    '.txt': ("📄", "View OCR Text"),
+    '.text': ("📄", "View OCR Text"),
+}
+
+# A .md readable version is labelled by its source file type (PDF or DOCX)
+_MD_SOURCE_LINKS = {
+    '.pdf': ("📄", "View PDF Text"),
+    '.docx': ("📄", "View Document"),
+    '.doc': ("📄", "View Document"),
+}
+
+def _readable_link(readable_path, source_ext):
+    """Return (icon, label) for a document's readable-version link"""
+    readable_ext = os.path.splitext(readable_path)[1].lower()
+    if readable_ext == '.md':
+        return _MD_SOURCE_LINKS.get(source_ext.lower(), _READABLE_LINKS['.md'])
+    return _READABLE_LINKS.get(readable_ext, ("📄", "View Converted"))
+
+# Markup for one category section and its documents. Compiled to bound
+# str.format methods once at import; _generate_category_section only
+# supplies the (already escaped) field values.
+_CATEGORY_OPEN_TEMPLATE = """      <section class="category" data-category="{category}">
+        <h2>{category}</h2>
+        <ul class="files">
+"""
+
+_CATEGORY_CLOSE_BYTES = b"""
+        </ul>
+      </section>
+
+"""
+
+_DOC_ITEM_TEMPLATE = """            <li class="file" data-path="{path}" data-link="{path}" data-mtime="{mtime}" data-search="{search}">
+      <div class="meta">
+        <div class="title"><a href="#{path}" class="file-link">{title}</a></div>
+        <div class="desc">{summary}{readable_link}</div>
+        <div class="tags small-muted">{file_ext} · {category}</div>
+        {mtime_html}
+      </div>
+            </li>"""
+
+_render_category_open = _CATEGORY_OPEN_TEMPLATE.format
+_render_doc_item = _DOC_ITEM_TEMPLATE.format
+_render_readable_link = '<br><small><a href="#{path}" style="color:var(--accent-2)">{icon} {label}</a></small>'.format
+_render_mtime = '<div class="mtime">📅 {}</div>'.format
 
 def _generate_category_section(category, docs):
-    """Generate a category section with document list"""
+    """Generate a category section with document list, as UTF-8 bytes
+
+    docs is a list of (title, file_path, doc_data) triples; it is sorted in
+    place by title (a stable sort on the precomputed key, so no per-compare
+    dict lookups).
+
+    Each document's markup is encoded straight into one growing bytearray
+    rather than collected as a list of strings and joined. The module-level
+    helpers are bound to locals so the per-document loop does fast local
+    lookups instead of global dictionary lookups.
+    """
     
     if not docs:
-        return ""
+        return b""
+    
+    docs.sort(key=itemgetter(0))
+    
+    esc = _esc
+    render_doc_item = _render_doc_item
+    render_mtime = _render_mtime
+    format_mtime = format_file_mtime
     
-    li_items = []
-    for file_path, doc_data in docs:
-        file_ext = Path(file_path).suffix.lstrip('.').upper() or 'N/A'
-        title = html_module.escape(doc_data.get("title", Path(file_path).stem))
-        summary = html_module.escape(doc_data.get("summary", ""))
-        path_escaped = html_module.escape(file_path)
+    category_escaped = _CATEGORY_ESCAPED.get(category) or esc(category)
+    search_tags = esc(f" · {category}".lower())
+    buf = bytearray(_render_category_open(category=category_escaped).encode('utf-8'))
+    append = buf.extend
+    for _, file_path, doc_data in docs:
+        get = doc_data.get
+        # One split per document instead of several Path() constructions
+        stem, ext = os.path.splitext(file_path.rpartition('/')[2])
+        file_ext = ext[1:].upper() or 'N/A'
         
         # Check if this has an original file link (image/PDF/DOCX paired with converted version)
-        original_link = ""
-        if doc_data.get("readable_version"):
-            readable_path = html_module.escape(doc_data["readable_version"])
-            original_file = Path(readable_path).stem
-            # Determine icon and label based on file type
-            if readable_path.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
-                icon = "🖼️"
-                label = "View Image"
-            elif readable_path.lower().endswith('.md'):
-                # Could be from PDF or DOCX
-                if file_path.lower().endswith('.pdf'):
-                    icon = "📄"
-                    label = "View PDF Text"
-                elif file_path.lower().endswith(('.docx', '.doc')):
-                    # For DOCX: view the markdown version like PDFs
-                    icon = "📄"
-                    label = "View Document"
-                else:
-                    icon = "📄"
-                    label = "View Markdown"
-            elif readable_path.lower().endswith(('.txt', '.text')):
-                icon = "📄"
-                label = "View OCR Text"
-            else:
-                icon = "📄"
-                label = "View Converted"
-            
-            # Assign the link
-            original_link = f'<br><small><a href="#{readable_path}" style="color:var(--accent-2)">{icon} {label}</a></small>'
+        readable_link = ""
+        readable_version = get("readable_version")
+        if readable_version:
+            readable_path = esc(readable_version)
+            icon, label = _readable_link(readable_path, ext)
+            readable_link = _render_readable_link(path=readable_path, icon=icon, label=label)
         
-        li = f"""            <li class="file" data-path="{path_escaped}" data-link="{path_escaped}" data-mtime="{doc_data.get('file_mtime', '')}">
-      <div class="meta">
-        <div class="title"><a href="#{path_escaped}" class="file-link">{title}</a></div>
-        <div class="desc">{summary}{original_link}</div>
-        <div class="tags small-muted">{file_ext} · {html_module.escape(category)}</div>
-        {f'<div class="mtime">📅 {format_file_mtime(doc_data.get("file_mtime", ""))}</div>' if doc_data.get("file_mtime") else ''}
-      </div>
-            </li>"""
-        li_items.append(li)
+        title = get("title", stem)
+        summary = get("summary", "")
+        # What the page's search box matches against, lowercased once here:
+        # title, summary and tags on separate lines (&#10;). Title and summary
+        # are unique per document, so they skip the memo cache.
+        search = (f"{html_module.escape(title.lower())}&#10;{html_module.escape(summary.lower())}"
+                  f"&#10;{esc(file_ext.lower())}{search_tags}")
+        
+        file_mtime = get("file_mtime", "")
+        append(render_doc_item(
+            path=esc(file_path),
+            mtime=file_mtime,
+            search=search,
+            title=esc(title),
+            summary=esc(summary),
+            readable_link=readable_link,
+            file_ext=file_ext,
+            category=category_escaped,
+            mtime_html=render_mtime(format_mtime(file_mtime)) if file_mtime else '',
+        ).encode('utf-8'))
     
-    category_escaped = html_module.escape(category)
-    return f"""      <section class="category" data-category="{category_escaped}">
-        <h2>{category_escaped}</h2>
-        <ul class="files">
-{"".join(li_items)}
-        </ul>
-      </section>
-
-"""
+    append(_CATEGORY_CLOSE_BYTES)
+    return buf
 
 def main():
     parser = argparse.ArgumentParser(description="Render index.html from .dms_state.json")
     parser.add_argument("--doc", default="Doc", help="Doc directory")
     parser.add_argument("--index", default="Doc/index.html", help="Path to output index.html")
+    parser.add_argument("--force", action="store_true", help="Re-render even if index.html is newer than the state")
+    parser.add_argument("--embed-state", action="store_true", help="Embed a copy of .dms_state.json in an HTML comment")
+    parser.add_argument("--iphone-index", help="Also render the mobile index to this path, reusing the loaded state")
     args = parser.parse_args()
     
     doc_dir = Path(args.doc)
@@ -473,7 +580,14 @@ def main():
         print(f"ERROR: {doc_dir} not found")
         return 1
     
-    return render_index_html(state_path, index_path)
+    result = render_index_html(state_path, index_path, force=args.force,
+                               embed_state=args.embed_state)
+    if result != 0 or not args.iphone_index:
+        return result
+    
+    # Same process, so the mobile renderer gets the cached state and buckets
+    from dms_render_iphone import render_index_html as render_iphone_html
+    return render_iphone_html(state_path, Path(args.iphone_index), force=args.force)
 
 if __name__ == "__main__":
     exit(main())
@@ -9,10 +9,12 @@ Usage:
   python3 dms_render_iphone.py --doc Doc --index Doc/index_iphone.html
 """
 import argparse
-import json
-import html as html_module
+import os
 from pathlib import Path
 from datetime import datetime
+from operator import itemgetter
+
+from dms_render_core import esc as _esc, load_and_bucket
 
 def format_file_mtime(mtime_iso: str) -> str:
     """Format ISO 8601 timestamp for display"""
@@ -24,7 +26,7 @@ def format_file_mtime(mtime_iso: str) -> str:
     except:
         return ""
 
-def render_index_html(state_path: Path, index_path: Path):
+def render_index_html(state_path: Path, index_path: Path, force: bool = False):
     """Generate index.html from .dms_state.json"""
     
     # Read state
@@ -32,28 +34,17 @@ def render_index_html(state_path: Path, index_path: Path):
         print(f"ERROR: {state_path} not found")
         return 1
     
-    state = json.loads(state_path.read_text(encoding='utf-8'))
-    
-    # Group documents by category
-    docs_by_category = {}
-    for category in state.get("categories", []):
-        docs_by_category[category] = []
-    
-    for file_path, doc_data in state.get("documents", {}).items():
-        category = doc_data.get("category", "Junk")
-        if category not in docs_by_category:
-            docs_by_category[category] = []
-        docs_by_category[category].append((file_path, doc_data))
-    
-    # Sort documents within each category
-    for category in docs_by_category:
-        docs_by_category[category].sort(key=lambda x: x[1].get("title", x[0]))
+    # Nothing to do if the page was written after the last state change
+    if (not force and index_path.exists()
+            and index_path.stat().st_mtime_ns >= state_path.stat().st_mtime_ns):
+        print(f"✓ {index_path} up to date (use --force to re-render)")
+        return 0
     
-    # Generate HTML
-    html_content = _generate_html(docs_by_category, state)
+    state, docs_by_category = load_and_bucket(state_path)
     
-    # Write index.html
-    index_path.write_text(html_content, encoding='utf-8')
+    # Generate HTML straight into index.html, fragment by fragment
+    with index_path.open('w', encoding='utf-8', buffering=1 << 20) as f:
+        _generate_html(docs_by_category, state, f.write)
     
     print(f"✓ Generated {index_path}")
     print(f"  Categories: {len(docs_by_category)}")
@@ -62,96 +53,86 @@ def render_index_html(state_path: Path, index_path: Path):
     
     return 0
 
-def _generate_html(docs_by_category, state):
-    """Generate the complete HTML from state"""
-    
-    # Embed state in HTML for reference (read-only, for debugging)
-    state_json = json.dumps(state, indent=2)
-    
-    categories_html = []
-    for category in state.get("categories", []):
-        docs = docs_by_category.get(category, [])
-        cat_html = _generate_category_section(category, docs)
-        categories_html.append(cat_html)
-    
-    html = f"""<!doctype html>
+# Static page markup around the category list. Plain strings (not
+# f-strings), so CSS and JS braces are written as-is.
+_HTML_HEAD = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width,initial-scale=1" />
   <title>Project Docs Index - Mobile</title>
   <style>
-    :root {{
+    :root {
       --bg: #0f1720;
       --panel: #0b1220;
       --muted: #9aa4b2;
       --accent: #79c0ff;
       --card: #0f1726;
-    }}
-    body {{
+    }
+    body {
       font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
       margin: 0;
       background-color: var(--bg);
       color: #e6eef6;
-    }}
-    #app {{
+    }
+    #app {
       display: flex;
       flex-direction: column;
       height: 100vh;
-    }}
-    #main-content {{
+    }
+    #main-content {
       display: flex;
       flex: 1;
       overflow: hidden;
-    }}
-    #sidebar {{
+    }
+    #sidebar {
       width: 100%;
       border-right: 1px solid rgba(255,255,255,0.03);
       overflow-y: auto;
       padding: 1rem;
       background: linear-gradient(180deg, rgba(255,255,255,0.012), rgba(255,255,255,0.008));
-    }}
-    #viewer {{
+    }
+    #viewer {
       display: none;
       flex: 1;
       flex-direction: column;
       padding: 1rem;
-    }}
-    header {{
+    }
+    header {
       padding: 1rem;
       border-bottom: 1px solid rgba(255,255,255,0.03);
-    }}
-    header h1 {{
+    }
+    header h1 {
       font-size: 1.25rem;
       margin: 0;
-    }}
-    .category h2 {{
+    }
+    .category h2 {
       font-size: 1rem;
       color: var(--accent);
       margin-top: 1.5rem;
-    }}
-    ul.files {{
+    }
+    ul.files {
       list-style: none;
       padding: 0;
-    }}
-    li.file {{
+    }
+    li.file {
       padding: 0.75rem;
       border-radius: 8px;
       margin: 0.5rem 0;
       background: linear-gradient(180deg, rgba(255,255,255,0.008), rgba(255,255,255,0.006));
       cursor: pointer;
-    }}
-    .file .title {{
+    }
+    .file .title {
       color: #dff3ff;
       font-weight: 600;
       font-size: 1rem;
-    }}
-    .file .desc {{
+    }
+    .file .desc {
       font-size: 0.875rem;
       color: var(--muted);
       line-height: 1.4;
-    }}
-    #back-button {{
+    }
+    #back-button {
         display: none;
         padding: 0.5rem 1rem;
         background-color: var(--accent);
@@ -160,18 +141,18 @@ def _generate_html(docs_by_category, state):
         border-radius: 5px;
         cursor: pointer;
         margin-bottom: 1rem;
-    }}
-    @media (min-width: 768px) {{
-      #main-content {{
+    }
+    @media (min-width: 768px) {
+      #main-content {
         flex-direction: row;
-      }}
-      #sidebar {{
+      }
+      #sidebar {
         width: 350px;
-      }}
-      #viewer {{
+      }
+      #viewer {
         display: flex;
-      }}
-    }}
+      }
+    }
   </style>
   <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
 </head>
@@ -182,7 +163,9 @@ def _generate_html(docs_by_category, state):
     </header>
     <div id="main-content">
       <section id="sidebar">
-        {"".join(categories_html)}
+        """
+
+_HTML_TAIL = """
       </section>
       <section id="viewer">
         <button id="back-button">Back to list</button>
@@ -203,7 +186,7 @@ def _generate_html(docs_by_category, state):
     const pdfViewer = document.getElementById('pdfViewer');
     const backButton = document.getElementById('back-button');
 
-    function openFilePreview(liElement) {{
+    function openFilePreview(liElement) {
         const path = liElement.dataset.path;
         const title = liElement.querySelector('.title').innerText;
         const readableVersion = liElement.dataset.readableVersion;
@@ -212,96 +195,137 @@ def _generate_html(docs_by_category, state):
         mdViewer.style.display = 'none';
         pdfViewer.style.display = 'none';
         
-        if (window.innerWidth < 768) {{
+        if (window.innerWidth < 768) {
             sidebar.style.display = 'none';
             viewer.style.display = 'flex';
             backButton.style.display = 'block';
-        }}
+        }
 
-        if (readableVersion && readableVersion !== "None") {{ // Check for "None" string too
+        if (readableVersion && readableVersion !== "None") { // Check for "None" string too
             fetch(readableVersion)
                 .then(response => response.text())
-                .then(text => {{
+                .then(text => {
                     mdViewer.innerHTML = marked.parse(text);
                     mdViewer.style.display = 'block';
-                }})
-                .catch(err => {{
+                })
+                .catch(err => {
                     console.error("Error fetching readable version:", err);
-                    mdViewer.innerHTML = `<p>Error loading content for ${{title}}.</p>`;
+                    mdViewer.innerHTML = `<p>Error loading content for ${title}.</p>`;
                     mdViewer.style.display = 'block';
-                }});
-        }} else if (path.endsWith('.pdf')) {{
+                });
+        } else if (path.endsWith('.pdf')) {
             pdfViewer.src = path;
             pdfViewer.style.display = 'block';
-        }} else {{
+        } else {
             fetch(path)
                 .then(response => response.text())
-                .then(text => {{
-                    mdViewer.innerHTML = `<pre>${{text}}</pre>`;
+                .then(text => {
+                    mdViewer.innerHTML = `<pre>${text}</pre>`;
                     mdViewer.style.display = 'block';
-                }})
-                .catch(err => {{
+                })
+                .catch(err => {
                     console.error("Error fetching raw file:", err);
-                    mdViewer.innerHTML = `<p>Error loading content for ${{title}}.</p>`;
+                    mdViewer.innerHTML = `<p>Error loading content for ${title}.</p>`;
                     mdViewer.style.display = 'block';
-                }});
-        }}
-    }}
+                });
+        }
+    }
 
-    function goBack() {{
+    function goBack() {
         sidebar.style.display = 'block';
         viewer.style.display = 'none';
         backButton.style.display = 'none';
-    }}
+    }
 
-    document.querySelectorAll('.file').forEach(item => {{
-      item.addEventListener('click', event => {{
+    document.querySelectorAll('.file').forEach(item => {
+      item.addEventListener('click', event => {
         openFilePreview(item);
-      }});
-    }});
+      });
+    });
 
     backButton.addEventListener('click', goBack);
   </script>
 </body>
 </html>"""
-    return html
 
-def _generate_category_section(category, docs):
-    """Generate a category section with document list"""
+def _generate_html(docs_by_category, state, write):
+    """Generate the complete HTML from state
+
+    Every fragment, down to each document's <li>, is passed to write (e.g.
+    a buffered file's write method, or list.append), so the page is never
+    held in memory as one string.
+    """
+    
+    write(_HTML_HEAD)
+    for category in state.get("categories", []):
+        _generate_category_section(category, docs_by_category.get(category, []), write)
+    write(_HTML_TAIL)
+
+# Markup for one category section and its documents, compiled to bound
+# str.format methods once at import
+_CATEGORY_OPEN_TEMPLATE = """<section class="category" data-category="{category}">
+        <h2>{category}</h2>
+        <ul class="files">
+"""
+
+_CATEGORY_CLOSE = """
+        </ul>
+      </section>"""
+
+_DOC_ITEM_TEMPLATE = """<li class="file" data-path="{path}" {readable_version_attr}>
+          <div class="title">{title}</div>
+          <div class="desc">{summary}</div>
+        </li>"""
+
+_render_category_open = _CATEGORY_OPEN_TEMPLATE.format
+_render_doc_item = _DOC_ITEM_TEMPLATE.format
+_render_readable_version_attr = 'data-readable-version="{}"'.format
+
+def _generate_category_section(category, docs, write):
+    """Write a category section with document list
+
+    docs is a list of (title, file_path, doc_data) triples, sorted here in
+    place by title.
+    """
     
     if not docs:
-        return ""
+        return
+    
+    docs.sort(key=itemgetter(0))
     
-    li_items = []
-    for file_path, doc_data in docs:
-        title = html_module.escape(doc_data.get("title", Path(file_path).stem))
-        summary = html_module.escape(doc_data.get("summary", ""))
-        path_escaped = html_module.escape(file_path)
-        readable_version = doc_data.get("readable_version", "")
+    esc = _esc
+    render_doc_item = _render_doc_item
+    
+    write(_render_category_open(category=esc(category)))
+    for _, file_path, doc_data in docs:
+        get = doc_data.get
+        readable_version = get("readable_version", "")
         
         # Conditionally include and escape readable_version
         readable_version_attr = ""
         if readable_version:
-            readable_version_attr = f'data-readable-version="{html_module.escape(readable_version)}"'
+            readable_version_attr = _render_readable_version_attr(esc(readable_version))
         
-        li = f"""<li class="file" data-path="{path_escaped}" {readable_version_attr}>
-          <div class="title">{title}</div>
-          <div class="desc">{summary}</div>
-        </li>"""
-        li_items.append(li)
-    
-    category_escaped = html_module.escape(category)
-    return f"""<section class="category" data-category="{category_escaped}">
-        <h2>{category_escaped}</h2>
-        <ul class="files">
-{"".join(li_items)}
-        </ul>
-      </section>"""
+        # Fall back to the file name without extension, split with plain
+        # string ops rather than a Path() per document
+        if "title" in doc_data:
+            title = doc_data["title"]
+        else:
+            title = os.path.splitext(file_path.rpartition('/')[2])[0]
+        
+        write(render_doc_item(
+            path=esc(file_path),
+            readable_version_attr=readable_version_attr,
+            title=esc(title),
+            summary=esc(get("summary", "")),
+        ))
+    write(_CATEGORY_CLOSE)
 
 def main():
     parser = argparse.ArgumentParser(description="Render a mobile-friendly index.html from .dms_state.json")
     parser.add_argument("--doc", default="Doc", help="Doc directory")
     parser.add_argument("--index", default="Doc/index_iphone.html", help="Path to output index.html")
+    parser.add_argument("--force", action="store_true", help="Re-render even if the page is newer than the state")
     args = parser.parse_args()
     
     doc_dir = Path(args.doc)
@@ -312,7 +336,7 @@ def main():
         print(f"ERROR: {doc_dir} not found")
         return 1
     
-    return render_index_html(state_path, index_path)
+    return render_index_html(state_path, index_path, force=args.force)
 
 if __name__ == "__main__":
     exit(main())
@@ -16,6 +16,11 @@ import json
 import subprocess
 from pathlib import Path
 
+try:
+    import orjson  # Optional: parses bytes directly, several times faster than json
+except ImportError:
+    orjson = None
+
 
 # Scripts dir is 2 levels up from this file's location
 SCRIPTS_DIR = Path(__file__).parent.parent
@@ -24,7 +29,24 @@ def load_pending_summaries(pending_path: Path) -> dict:
     """Load pending summaries from summarize step"""
     if not pending_path.exists():
         return {"summaries": []}
-    return json.loads(pending_path.read_text(encoding='utf-8'))
+    raw = pending_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+_SEP = "=" * 70
+
+# Show that approve is the default by indicating it in the prompt
+_PROMPT = "\n[a]pprove (default), [e]dit, [c]ategory, [s]kip, [q]uit? > "
+
+def ask(prompt: str) -> str:
+    """Write prompt in one call and read a line, like input()"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line
 
 def approve_summary(summary_info: dict) -> bool:
     """Interactive approval of a single summary"""
@@ -32,15 +54,12 @@ def approve_summary(summary_info: dict) -> bool:
     summary = summary_info['summary']
     category = summary_info['category']
     
-    print(f"\n{'='*70}")
-    print(f"File: {file_path}")
-    print(f"Summary: {summary}")
-    print(f"Category: {category}")
-    print(f"{'='*70}")
+    # The header goes out with the first prompt as a single write
+    header = f"\n{_SEP}\nFile: {file_path}\nSummary: {summary}\nCategory: {category}\n{_SEP}\n"
     
     while True:
-        # Show that approve is the default by indicating it in the prompt
-        choice = input("\n[a]pprove (default), [e]dit, [c]ategory, [s]kip, [q]uit? > ").strip().lower()
+        choice = ask(header + _PROMPT).strip().lower()
+        header = ""
         # Treat an empty input (simple Enter) as approve
         if choice == '':
             choice = 'a'
@@ -125,7 +144,10 @@ def main():
         "summaries": approved
     }
     
-    approved_path.write_text(json.dumps(approved_data, indent=2), encoding='utf-8')
+    if orjson is not None:
+        approved_path.write_bytes(orjson.dumps(approved_data, option=orjson.OPT_INDENT_2))
+    else:
+        approved_path.write_text(json.dumps(approved_data, indent=2), encoding='utf-8')
     
     print(f"✓ Saved {len(approved)} approved summary/summaries to {approved_path}")
     print(f"\nNext step:")
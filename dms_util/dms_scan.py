@@ -6,31 +6,121 @@ Compares current filesystem state against .dms_state.json
 Identifies:
   - New files (not in state)
   - Changed files (hash mismatch)
+  - Renamed files (same inode, size and mtime as a missing file)
   - Missing files (in state but not on disk)
 
-Outputs a scan report (no state changes - just detection).
+Outputs a scan report. The only state changes are refreshing the cached
+size/mtime of files whose content turned out to be unchanged, and
+recording the tree signature of a clean scan.
 """
 import argparse
 import sys
 import json
 import hashlib
+import mmap
+import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from fnmatch import fnmatch
+from fnmatch import translate
 
-def compute_file_hash(path: Path) -> str:
-    """Compute SHA-256 hash of file contents"""
-    sha = hashlib.sha256()
-    with path.open('rb') as f:
-        while chunk := f.read(8192):
-            sha.update(chunk)
+try:
+    import orjson  # Optional: parses bytes directly, several times faster than json
+except ImportError:
+    orjson = None
+
+try:
+    import blake3  # Optional: SIMD/multithreaded hashing, much faster than SHA-256
+except ImportError:
+    blake3 = None
+
+# hashlib.sha256 is OpenSSL's on most builds, which picks SHA-NI/AVX2 code
+# at runtime. Builds that fall back to CPython's portable C SHA-256 use the
+# OpenSSL-backed cryptography package instead, when it is installed.
+Hash = SHA256 = None
+if hashlib.sha256.__name__ != "openssl_sha256":
+    try:
+        from cryptography.hazmat.primitives.hashes import Hash, SHA256
+    except ImportError:
+        pass
+
+# Algorithm for newly hashed files. Hashes are only used to detect content
+# changes, so any strong hash will do; stored hashes carry an "algo:" prefix.
+HASH_ALGO = "blake3" if blake3 is not None else "sha256"
+
+# Files at least this big are mmap'd for SHA-256 instead of read in chunks
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# Files up to this size are read whole and hashed in a single call
+SMALL_FILE_BYTES = 64 * 1024
+
+def compute_file_hash(path, algo: str = HASH_ALGO, size: int = None) -> str:
+    """Hash file contents as "<algo>:<hexdigest>" (path: Path, str or os.DirEntry)
+
+    size, if the caller already has it from a stat, saves an fstat here.
+    """
+    if size is not None and size <= SMALL_FILE_BYTES:
+        # Small file (the common notes/config case): one read() and one hash
+        # call, skipping the per-file buffer, readahead hint or mmap setup
+        with open(path, 'rb') as f:
+            data = f.read()
+        if algo == "blake3" and blake3 is not None:
+            return f"blake3:{blake3.blake3(data).hexdigest()}"
+        return f"sha256:{hashlib.sha256(data).hexdigest()}"
+    
+    if algo == "blake3" and blake3 is not None:
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hasher.update_mmap(path)
+        return f"blake3:{hasher.hexdigest()}"
+    
+    if Hash is not None:
+        return _sha256_cryptography(path)
+    
+    with open(path, 'rb') as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD_BYTES:
+            # Large file: map it and hash it in a single C call, no read copies
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return f"sha256:{hashlib.sha256(mm).hexdigest()}"
+        if hasattr(os, "posix_fadvise"):
+            # Whole-file sequential read: let the kernel read ahead harder
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the read/update loop runs in C
+            sha = hashlib.file_digest(f, "sha256")
+        else:
+            # Older Pythons: 1 MiB reads keep the Python-level loop short
+            # (hashlib drops the GIL for each update call)
+            sha = hashlib.sha256()
+            while chunk := f.read(1024 * 1024):
+                sha.update(chunk)
     return f"sha256:{sha.hexdigest()}"
 
-def get_file_mtime_iso(path: Path) -> str:
-    """Get file modification time in ISO 8601 format"""
-    mtime = path.stat().st_mtime
-    return datetime.fromtimestamp(mtime).isoformat()
+def _sha256_cryptography(path) -> str:
+    """SHA-256 via the cryptography package's OpenSSL binding"""
+    sha = Hash(SHA256())
+    with open(path, 'rb') as f:
+        while chunk := f.read(1024 * 1024):
+            sha.update(chunk)
+    return f"sha256:{sha.finalize().hex()}"
+
+def hash_for_compare(path, old_hash: str, size: int = None) -> str:
+    """Hash a file with the same algorithm as its stored hash, if there is one
+
+    Comparing like with like means switching HASH_ALGO does not make every
+    tracked file look changed; new files get HASH_ALGO.
+    """
+    algo = old_hash.partition(":")[0] if old_hash else HASH_ALGO
+    return compute_file_hash(path, algo, size)
+
+def get_file_mtime_iso(st: os.stat_result) -> str:
+    """Get file modification time in ISO 8601 format from a stat result"""
+    return datetime.fromtimestamp(st.st_mtime).isoformat()
 
 def load_state(state_path: Path) -> dict:
     """Load .dms_state.json"""
@@ -42,7 +132,10 @@ def load_state(state_path: Path) -> dict:
         }
     
     try:
-        return json.loads(state_path.read_text(encoding='utf-8'))
+        raw = state_path.read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
     except Exception as e:
         print(f"WARNING: Error loading state: {e}", file=sys.stderr)
         return {
@@ -51,6 +144,12 @@ def load_state(state_path: Path) -> dict:
             "documents": {}
         }
 
+def save_state(state_path: Path, state: dict):
+    """Write .dms_state.json atomically (temp file, then rename)"""
+    tmp_path = state_path.parent / f"{state_path.name}.tmp"
+    tmp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+    os.replace(tmp_path, state_path)
+
 def load_ignore_list() -> set:
     """Load dms_ignore.json from scripts directory"""
     scripts_dir = Path(__file__).parent.parent
@@ -67,16 +166,58 @@ def load_ignore_list() -> set:
         print(f"WARNING: Error loading ignore list: {e}", file=sys.stderr)
         return set()
 
-def is_ignored(filename: str, ignore_list: set) -> bool:
-    """Check if filename matches any pattern in ignore list
+def compile_ignore_list(ignore_list: set):
+    """Compile ignore patterns into one regex (None if there are none)
     
     Supports both exact matches and wildcards (fnmatch patterns)
     Examples: "index.html", "*.log", "DMS_LOG_*"
     """
-    for pattern in ignore_list:
-        if fnmatch(filename, pattern):
-            return True
-    return False
+    if not ignore_list:
+        return None
+    return re.compile('|'.join(f'(?:{translate(pattern)})' for pattern in sorted(ignore_list)))
+
+def is_ignored(filename: str, ignore_pattern) -> bool:
+    """Check if filename matches the compiled ignore patterns
+    
+    One C-level regex match per file instead of an fnmatch call per pattern.
+    """
+    return ignore_pattern is not None and ignore_pattern.match(filename) is not None
+
+def walk_files(directory, prefix: str = "./"):
+    """Yield (relative_path, os.DirEntry) for every non-hidden file under directory
+
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so telling files from directories costs no extra stat() call.
+    Hidden entries are skipped by name before anything else, which prunes
+    hidden directories (.git, .Trash, ...) without listing them.
+    Symlinked directories are not followed.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Skip hidden files and directories
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_files(entry.path, f"{prefix}{entry.name}/")
+            elif entry.is_file():
+                yield f"{prefix}{entry.name}", entry
+
+def tree_signature(disk_files: dict, state_docs: dict, ignore_list: set) -> str:
+    """Fingerprint everything a scan's result depends on
+    
+    Covers each file's path, size and mtime (from the DirEntry's cached
+    stat), each state document's path, hash, size and mtime, and the ignore
+    patterns. If none of those changed, neither can the scan's result.
+    """
+    parts = sorted(ignore_list or ())
+    for rel_path in sorted(disk_files):
+        st = disk_files[rel_path].stat()
+        parts.append(f"{rel_path}\0{st.st_size}\0{st.st_mtime_ns}")
+    parts.append("")  # separates disk entries from state entries
+    for rel_path in sorted(state_docs):
+        doc = state_docs[rel_path]
+        parts.append(f"{rel_path}\0{doc.get('hash', '')}\0{doc.get('size')}\0{doc.get('file_mtime_ns')}")
+    return hashlib.sha256("\n".join(parts).encode('utf-8', errors='surrogateescape')).hexdigest()
 
 def scan_directory(doc_dir: Path, state: dict, ignore_list: set = None) -> tuple:
     """Scan Doc/ directory and detect changes
@@ -91,141 +232,179 @@ def scan_directory(doc_dir: Path, state: dict, ignore_list: set = None) -> tuple
         state: Loaded state dict
         ignore_list: Set of patterns to ignore (e.g., {"index.html", "DMS_LOG_*"})
     
+    A file whose (st_dev, st_ino), size and mtime match a document that is
+    no longer at its recorded path was renamed or moved: it is reported in
+    renamed_files with its stored hash, without being read.
+    
+    A file that was hashed but whose content matches the state (e.g. it was
+    only touched, or its entry predates the stored size/mtime) has its
+    size, mtime and inode refreshed in state, so the next scan skips it.
+    
+    A clean scan stores a tree_signature in state["metadata"]; while it
+    still matches, the next scan returns no changes right after the walk.
+    
     Returns:
-        Tuple of (new_files, changed_files, missing_files, ignored_files)
+        Tuple of (new_files, changed_files, missing_files, ignored_files,
+        renamed_files, refreshed_files)
     """
     
-    if ignore_list is None:
-        ignore_list = set()
+    ignore_pattern = compile_ignore_list(ignore_list)
     
     new_files = []
     changed_files = []
     missing_files = []
     ignored_files = []
+    renamed_files = []
+    refreshed_files = []
     
+    # Kept as the state's own dict-of-dicts: each candidate needs one lookup
+    # and three field reads, which is small next to its stat() syscall.
     state_docs = state.get("documents", {})
     
-    # Find files on disk
-    disk_files = {}
-    for file_path in doc_dir.rglob("*"):
-        if file_path.is_file():
-            # Skip hidden files and common non-doc files
-            if file_path.name.startswith('.'):
-                continue
-            # Relative path from doc_dir
-            rel_path = f"./{file_path.relative_to(doc_dir)}"
-            disk_files[rel_path] = file_path
-    
-    # Find which files have readable versions in md_outputs
-    # Maps original file -> readable file
-    readable_versions = {}
-    orphaned_readables = set()  # md_outputs files without a matching original
-    
-    for rel_path in disk_files.keys():
-        if './md_outputs/' in rel_path:
-            # This is a readable version
-            # Find its corresponding original
-            # For files like IMG_4666.jpeg.txt, we need IMG_4666.jpeg
-            filename_with_ext = Path(rel_path).name
-            if filename_with_ext.endswith('.txt'):
-                # Remove .txt extension
-                filename_no_txt = filename_with_ext[:-4]  # e.g., "IMG_4666.jpeg" or "IMG_4666 copy"
-                
-                # Look for matching original in root
-                found_original = False
-                for orig_path in disk_files.keys():
-                    if './md_outputs/' not in orig_path:  # In root
-                        orig_name = Path(orig_path).name
-                        # Match: filename_no_txt could be either:
-                        # 1. The full original name (IMG_4666.jpeg.txt -> IMG_4666.jpeg)
-                        # 2. The original without extension (IMG_4666.jpeg.txt from image-to-text -> IMG_4666.jpeg)
-                        if orig_name == filename_no_txt or orig_name.startswith(filename_no_txt):
-                            readable_versions[orig_path] = rel_path
-                            found_original = True
-                            break
-                
-                if not found_original:
-                    # md_outputs file with no matching original - skip it
-                    orphaned_readables.add(rel_path)
-    
-    # Check for new and changed files
-    for rel_path, file_path in disk_files.items():
+    # Find files on disk (relative path from doc_dir -> os.DirEntry)
+    disk_files = dict(walk_files(doc_dir))
+    
+    # Nothing on disk, in the state or in the ignore list changed since the
+    # last scan that found no changes: report clean without classifying
+    # or hashing anything. Only the (cheap) ignore matching is redone so
+    # the report still lists ignored files.
+    metadata = state.setdefault("metadata", {})
+    if metadata.get("tree_signature") == tree_signature(disk_files, state_docs, ignore_list):
+        ignored_files = [rel_path for rel_path, entry in disk_files.items()
+                         if './md_outputs/' not in rel_path and is_ignored(entry.name, ignore_pattern)]
+        return new_files, changed_files, missing_files, ignored_files, renamed_files, refreshed_files
+    
+    # Documents in state but not on disk (set difference of the key views,
+    # in C). Those with a recorded inode are rename candidates.
+    missing_keys = state_docs.keys() - disk_files.keys()
+    missing_by_inode = {}
+    for rel_path in missing_keys:
+        doc = state_docs[rel_path]
+        if doc.get("ino") and doc.get("hash"):
+            missing_by_inode[(doc.get("dev"), doc["ino"])] = rel_path
+    
+    # Check for new and changed files. First pick out the files that need
+    # hashing, then hash them in parallel and classify the results.
+    to_hash = []
+    for rel_path, entry in disk_files.items():
         # Skip all md_outputs files (whether paired or orphaned)
         if './md_outputs/' in rel_path:
             continue
         
         # Skip ignored files
-        filename = Path(rel_path).name
-        if is_ignored(filename, ignore_list):
+        filename = entry.name
+        if is_ignored(filename, ignore_pattern):
             ignored_files.append(rel_path)
             continue
         
-        # For original files that have readable versions:
-        # Just process the original file normally, don't track the readable version separately
-        # The readable version is only used during summarization
-        if rel_path in readable_versions:
-            # Process the original file, not the readable version
-            file_hash = compute_file_hash(file_path)
-            
-            if rel_path not in state_docs:
-                # New file
-                new_files.append({
-                    "path": rel_path,
-                    "hash": file_hash,
-                    "size": file_path.stat().st_size,
-                    "file_mtime": get_file_mtime_iso(file_path)
-                })
-            else:
-                # Check if changed (but skip if old hash is empty - file just wasn't hashed yet)
-                old_hash = state_docs[rel_path].get("hash", "")
-                if old_hash and old_hash != file_hash:
-                    changed_files.append({
-                        "path": rel_path,
-                        "hash": file_hash,
-                        "old_hash": old_hash,
-                        "new_hash": file_hash
-                    })
-            
-            # Skip to next file
+        # Fast path: same size and mtime as when it was last hashed means
+        # unchanged, so skip reading and hashing the file entirely
+        st = entry.stat()  # DirEntry: one stat() syscall, then cached
+        doc = state_docs.get(rel_path)
+        if (doc is not None and doc.get("hash")
+                and doc.get("size") == st.st_size
+                and doc.get("file_mtime_ns") == st.st_mtime_ns):
             continue
         
-        # For files without readable versions, process normally
-        file_hash = compute_file_hash(file_path)
+        # Renamed/moved: same inode, size and mtime as a missing document,
+        # so the content is unchanged and the stored hash carries over
+        if doc is None and missing_by_inode:
+            old_path = missing_by_inode.get((st.st_dev, st.st_ino))
+            old_doc = state_docs.get(old_path)
+            if (old_doc is not None
+                    and old_doc.get("size") == st.st_size
+                    and old_doc.get("file_mtime_ns") == st.st_mtime_ns):
+                renamed_files.append({
+                    "path": rel_path,
+                    "old_path": old_path,
+                    "hash": old_doc["hash"]
+                })
+                missing_keys.discard(old_path)
+                del missing_by_inode[(st.st_dev, st.st_ino)]
+                continue
         
-        if rel_path not in state_docs:
+        # Original files that have readable versions are processed like any
+        # other file; the readable version is not tracked separately and is
+        # only used during summarization. The DirEntry itself is handed to
+        # the hasher, which opens it by its string path; no Path is built.
+        to_hash.append((rel_path, entry, st, doc))
+    
+    # hashlib releases the GIL while hashing, and reads block on the disk,
+    # so threads overlap both. Files are submitted largest first, so the
+    # long hashes start right away and small ones fill in around them;
+    # results are put back in listing order so the report stays stable.
+    order = sorted(range(len(to_hash)), key=lambda i: to_hash[i][2].st_size, reverse=True)
+    file_hashes = [None] * len(to_hash)
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        hashes = executor.map(hash_for_compare,
+                              [to_hash[i][1] for i in order],
+                              [(to_hash[i][3] or {}).get("hash", "") for i in order],
+                              [to_hash[i][2].st_size for i in order])
+        for i, file_hash in zip(order, hashes):
+            file_hashes[i] = file_hash
+    
+    for (rel_path, entry, st, doc), file_hash in zip(to_hash, file_hashes):
+        if doc is None:
             # New file
             new_files.append({
                 "path": rel_path,
                 "hash": file_hash,
-                "size": file_path.stat().st_size,
-                "file_mtime": get_file_mtime_iso(file_path)
+                "size": st.st_size,
+                "file_mtime": get_file_mtime_iso(st),
+                "file_mtime_ns": st.st_mtime_ns,
+                "dev": st.st_dev,
+                "ino": st.st_ino
             })
         else:
             # Check if changed (but skip if old hash is empty - file just wasn't hashed yet)
-            old_hash = state_docs[rel_path].get("hash", "")
-            if old_hash and old_hash != file_hash:
+            old_hash = doc.get("hash", "")
+            if old_hash and old_hash == file_hash:
+                # Unchanged content but a stale (or no) stat fingerprint:
+                # record the current one so this file is hashed only once
+                doc["size"] = st.st_size
+                doc["file_mtime_ns"] = st.st_mtime_ns
+                doc["dev"] = st.st_dev
+                doc["ino"] = st.st_ino
+                refreshed_files.append(rel_path)
+            elif old_hash and old_hash != file_hash:
                 changed_files.append({
                     "path": rel_path,
                     "hash": file_hash,
                     "old_hash": old_hash,
-                    "new_hash": file_hash
+                    "new_hash": file_hash,
+                    "size": st.st_size,
+                    "file_mtime_ns": st.st_mtime_ns,
+                    "dev": st.st_dev,
+                    "ino": st.st_ino
                 })
     
-    # Check for missing files (in state but not on disk)
-    for rel_path, doc_data in state_docs.items():
-        if rel_path not in disk_files:
-            missing_files.append({
-                "path": rel_path,
-                "was_category": doc_data.get("category", "Unknown")
-            })
+    # Report missing files (in state but not on disk, and not renamed). The
+    # set is usually empty; when it is not, walk the state in order so the
+    # report lists them as the state does.
+    if missing_keys:
+        for rel_path, doc_data in state_docs.items():
+            if rel_path in missing_keys:
+                missing_files.append({
+                    "path": rel_path,
+                    "was_category": doc_data.get("category", "Unknown")
+                })
+    
+    # A clean scan means the state matches the disk: remember the tree's
+    # signature (after any refreshes) so the next scan can stop early
+    if not (new_files or changed_files or missing_files or renamed_files):
+        metadata["tree_signature"] = tree_signature(disk_files, state_docs, ignore_list)
     
-    return new_files, changed_files, missing_files, ignored_files
+    return new_files, changed_files, missing_files, ignored_files, renamed_files, refreshed_files
 
-def print_report(new_files, changed_files, missing_files, ignored_files=None, status_only=False):
+def print_report(new_files, changed_files, missing_files, ignored_files=None, status_only=False,
+                 renamed_files=None):
     """Print scan report"""
     
     if ignored_files is None:
         ignored_files = []
+    if renamed_files is None:
+        renamed_files = []
     
     print(f"\n=== DMS SCAN REPORT ===\n")
     print(f"New files: {len(new_files)}")
@@ -242,6 +421,13 @@ def print_report(new_files, changed_files, missing_files, ignored_files=None, st
         if len(changed_files) > 10:
             print(f"  ... and {len(changed_files) - 10} more")
     
+    print(f"\nRenamed files: {len(renamed_files)}")
+    if renamed_files and not status_only:
+        for f in renamed_files[:10]:
+            print(f"  → {f['old_path']} -> {f['path']}")
+        if len(renamed_files) > 10:
+            print(f"  ... and {len(renamed_files) - 10} more")
+    
     print(f"\nMissing files: {len(missing_files)}")
     if missing_files and not status_only:
         for f in missing_files[:10]:
@@ -256,7 +442,7 @@ def print_report(new_files, changed_files, missing_files, ignored_files=None, st
         if len(ignored_files) > 10:
             print(f"  ... and {len(ignored_files) - 10} more")
     
-    total = len(new_files) + len(changed_files) + len(missing_files)
+    total = len(new_files) + len(changed_files) + len(missing_files) + len(renamed_files)
     print(f"\nTotal changes: {total}")
     
     if total == 0:
@@ -270,9 +456,18 @@ def check_for_convertible_files(new_files):
     pdf_exts = {'.pdf'}
     docx_exts = {'.docx', '.doc'}
     
-    images = [f for f in new_files if Path(f['path']).suffix.lower() in image_exts]
-    pdfs = [f for f in new_files if Path(f['path']).suffix.lower() in pdf_exts]
-    docx_files = [f for f in new_files if Path(f['path']).suffix.lower() in docx_exts]
+    # One pass, one splitext per file (rather than a Path per file per type)
+    images = []
+    pdfs = []
+    docx_files = []
+    for f in new_files:
+        ext = os.path.splitext(f['path'])[1].lower()
+        if ext in image_exts:
+            images.append(f)
+        elif ext in pdf_exts:
+            pdfs.append(f)
+        elif ext in docx_exts:
+            docx_files.append(f)
     
     return {
         'images': images,
@@ -284,6 +479,7 @@ def main():
     parser = argparse.ArgumentParser(description="Scan Doc/ directory for changes")
     parser.add_argument("--doc", default="Doc", help="Doc directory")
     parser.add_argument("--status-only", action="store_true", help="Just show status, don't save")
+    parser.add_argument("--pretty", action="store_true", help="Indent .dms_scan.json for reading")
     args = parser.parse_args()
     
     doc_dir = Path(args.doc)
@@ -300,10 +496,19 @@ def main():
     ignore_list = load_ignore_list()
     
     # Scan directory
-    new_files, changed_files, missing_files, ignored_files = scan_directory(doc_dir, state, ignore_list)
+    old_signature = state.get("metadata", {}).get("tree_signature")
+    (new_files, changed_files, missing_files, ignored_files, renamed_files,
+     refreshed_files) = scan_directory(doc_dir, state, ignore_list)
+    
+    # Persist refreshed size/mtime fingerprints so unchanged files are not
+    # hashed again next scan, and a new tree signature so an unchanged tree
+    # is not classified again
+    if (refreshed_files or state["metadata"].get("tree_signature") != old_signature) and not args.status_only:
+        save_state(state_path, state)
     
     # Print report
-    total = print_report(new_files, changed_files, missing_files, ignored_files, args.status_only)
+    total = print_report(new_files, changed_files, missing_files, ignored_files, args.status_only,
+                         renamed_files)
     
     if total == 0:
         return 0
@@ -317,11 +522,15 @@ def main():
         "timestamp": datetime.now().isoformat(),
         "new_files": new_files,
         "changed_files": changed_files,
-        "missing_files": missing_files
+        "missing_files": missing_files,
+        "renamed_files": renamed_files
     }
     
     scan_file = doc_dir / ".dms_scan.json"
-    scan_file.write_text(json.dumps(scan_result, indent=2))
+    if orjson is not None:
+        scan_file.write_bytes(orjson.dumps(scan_result, option=orjson.OPT_INDENT_2 if args.pretty else 0))
+    else:
+        scan_file.write_text(json.dumps(scan_result, indent=2 if args.pretty else None))
     
     print(f"\n✓ Scan results saved to {scan_file}")
     
@@ -333,7 +542,10 @@ def main():
         }
         
         deletion_file = doc_dir / ".dms_missing_for_deletion.json"
-        deletion_file.write_text(json.dumps(missing_for_deletion, indent=2))
+        if orjson is not None:
+            deletion_file.write_bytes(orjson.dumps(missing_for_deletion, option=orjson.OPT_INDENT_2 if args.pretty else 0))
+        else:
+            deletion_file.write_text(json.dumps(missing_for_deletion, indent=2 if args.pretty else None))
         print(f"✓ Saved missing files to {deletion_file.name}")
     
     # Clean up old pending files from previous workflow runs
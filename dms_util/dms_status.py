@@ -13,6 +13,7 @@ Displays:
 import argparse
 import sys
 import json
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
@@ -70,10 +71,7 @@ def main():
     print(f"📚 DOCUMENTS: {total_docs}\n")
     
     # Category breakdown
-    by_cat = {}
-    for doc in state.get('documents', {}).values():
-        cat = doc.get('category', 'Unknown')
-        by_cat[cat] = by_cat.get(cat, 0) + 1
+    by_cat = Counter(doc.get('category', 'Unknown') for doc in state.get('documents', {}).values())
     
     print("📁 Categories:")
     for cat in sorted(by_cat.keys()):
@@ -11,78 +11,250 @@ Does NOT update .dms_state.json (that happens in apply).
 import argparse
 import sys
 import json
+import hashlib
+import os
+import random
 import requests
 import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: serializes straight to bytes, several times faster than json
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: streaming parser, lets us read just the categories
+except ImportError:
+    ijson = None
+
+# One keep-alive session for every Ollama call, so each request reuses an
+# open connection instead of paying a new TCP (and TLS) handshake. Failed
+# connects are retried with backoff (a POST that reached the server is not
+# resent). main() resizes the pools once the hosts and concurrency are known.
+_SESSION = requests.Session()
+
+def size_session(host_count: int, concurrency: int):
+    """Mount an adapter on _SESSION with one connection pool per Ollama
+    host, each big enough for that host's requests in flight
+    
+    With fewer pools than hosts, alternating hosts would evict and close
+    each other's pools; with fewer connections than requests in flight,
+    the extra connections would be discarded after every request.
+    """
+    adapter = HTTPAdapter(pool_connections=max(1, host_count),
+                          pool_maxsize=max(1, concurrency),
+                          max_retries=Retry(total=3, backoff_factor=0.5))
+    _SESSION.mount("http://", adapter)
+    _SESSION.mount("https://", adapter)
+
+size_session(1, 16)
 
 def load_config() -> dict:
-    """Load DMS config"""
+    """Load DMS config
+    
+    "ollama_hosts" (a list) spreads summaries across several Ollama servers;
+    without it the single "ollama_host" is used.
+    """
     config_path = Path(__file__).parent.parent / "dms_config.json"
     if not config_path.exists():
         return {
             "ollama_model": "phi4:14b",
             "ollama_host": "https://ollama.ldmathes.cc",
             "summary_max_words": 50,
-            "temperature": 0.3
+            "temperature": 0.3,
+            "ollama_concurrency": 4
         }
     return json.loads(config_path.read_text(encoding='utf-8'))
 
+def read_json(path: Path):
+    """Parse a JSON file, with orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding='utf-8'))
+
 def load_scan_results(scan_path: Path) -> dict:
     """Load .dms_scan.json"""
     if not scan_path.exists():
         return {"new_files": [], "changed_files": []}
-    return json.loads(scan_path.read_text(encoding='utf-8'))
+    return read_json(scan_path)
 
 def load_state(state_path: Path) -> dict:
-    """Load .dms_state.json to get existing categories"""
+    """Load .dms_state.json to get existing categories
+    
+    Only "categories" is used here. With ijson installed it is streamed and
+    parsing stops at the end of the list, which the state file writes
+    before "documents", so the documents are never read or parsed;
+    "documents" comes back empty in that case.
+    """
     if not state_path.exists():
         return {"categories": [], "documents": {}}
     try:
-        return json.loads(state_path.read_text(encoding='utf-8'))
+        if ijson is not None:
+            categories = []
+            with state_path.open('rb') as f:
+                for prefix, event, value in ijson.parse(f):
+                    if prefix == 'categories.item':
+                        categories.append(value)
+                    elif prefix == 'categories' and event == 'end_array':
+                        break
+            return {"categories": categories, "documents": {}}
+        return read_json(state_path)
     except:
         return {"categories": [], "documents": {}}
 
+# Only this much of a document is sent to Ollama
+MAX_CONTENT_CHARS = 2000
+
+# Threads reading documents ahead of the Ollama requests
+READ_WORKERS = 16
+
+# Files read directly as text
+TEXT_EXTS = frozenset({'.txt', '.md', '.html', '.py', '.js', '.json'})
+# Files summarized from their md_outputs/ conversion: images via OCR .txt,
+# PDF/DOCX via .md
+IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'})
+DOC_EXTS = frozenset({'.pdf', '.docx', '.doc'})
+# Known binary formats: with no conversion they are summarized from the
+# file name alone (the content is never read)
+BINARY_EXTS = IMAGE_EXTS | DOC_EXTS | frozenset({
+    '.heic', '.tif', '.tiff', '.ico', '.svgz',
+    '.xls', '.xlsx', '.ppt', '.pptx', '.odt', '.ods', '.odp', '.pages', '.numbers', '.key',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.tar', '.dmg', '.iso', '.pkg',
+    '.mp3', '.m4a', '.wav', '.flac', '.mp4', '.mov', '.avi', '.mkv',
+    '.exe', '.dll', '.so', '.dylib', '.bin', '.pyc', '.sqlite', '.db',
+})
+
+def read_text_head(path: Path) -> str:
+    """Read the first MAX_CONTENT_CHARS characters of a text file
+    
+    Text-mode read(n) counts characters and translates newlines, so the
+    result is the same as read_text()[:MAX_CONTENT_CHARS] without reading
+    a large file in full.
+    """
+    with path.open(encoding='utf-8', errors='replace') as f:
+        return f.read(MAX_CONTENT_CHARS)
+
 def read_file_content(file_path: Path) -> str:
     """Read file content safely"""
     try:
-        if file_path.suffix in {'.txt', '.md', '.html', '.py', '.js', '.json'}:
-            return file_path.read_text(encoding='utf-8', errors='replace')[:2000]
+        if file_path.suffix.lower() in TEXT_EXTS:
+            return read_text_head(file_path)
         return f"[Binary file: {file_path.name}]"
     except Exception as e:
         return f"[Error reading file: {e}]"
 
-def find_text_conversion(file_path: str, doc_dir: Path) -> str:
-    """Check if file has a text/markdown version in md_outputs/ (for images, PDFs, or DOCX)"""
-    file_name = Path(file_path).name
-    file_stem = Path(file_path).stem
-    file_ext = Path(file_path).suffix.lower()
+def find_text_conversion(file_path: str, doc_dir: Path, md_names: set = None) -> tuple:
+    """Check if file has a text/markdown version in md_outputs/ (for images, PDFs, or DOCX)
+    
+    md_names, from list_md_names(), lets a caller converting many files
+    skip candidates that are not there without touching the disk.
+    
+    Returns:
+        Tuple of (content, conversion_path) for the conversion that was read,
+        e.g. ("...", "./md_outputs/IMG_4664.jpeg.txt"), or (None, None)
+    """
+    path = Path(file_path)
+    file_name, file_stem, file_ext = path.name, path.stem, path.suffix.lower()
     
     # For images: look for .txt conversions
-    if file_ext in {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}:
-        # Try exact match first: IMG_4664.jpeg.txt
-        text_file = doc_dir / "md_outputs" / (file_name + ".txt")
-        if text_file.exists():
-            return text_file.read_text(encoding='utf-8', errors='replace')[:2000]
-        
-        # Try stem only: IMG_4664.txt
-        text_file = doc_dir / "md_outputs" / (file_stem + ".txt")
-        if text_file.exists():
-            return text_file.read_text(encoding='utf-8', errors='replace')[:2000]
+    if file_ext in IMAGE_EXTS:
+        # Try exact match first (IMG_4664.jpeg.txt), then stem only (IMG_4664.txt)
+        candidates = (file_name + ".txt", file_stem + ".txt")
     
     # For PDFs and DOCX: look for .md conversions
-    elif file_ext in {'.pdf', '.docx', '.doc'}:
+    elif file_ext in DOC_EXTS:
         # Try stem: document.md
-        md_file = doc_dir / "md_outputs" / (file_stem + ".md")
-        if md_file.exists():
-            return md_file.read_text(encoding='utf-8', errors='replace')[:2000]
+        candidates = (file_stem + ".md",)
     
-    return None
+    else:
+        return None, None
+    
+    # Open directly rather than probing with exists() first: one syscall
+    # for a hit instead of two
+    for candidate in candidates:
+        if md_names is not None and candidate not in md_names:
+            continue
+        try:
+            return read_text_head(doc_dir / "md_outputs" / candidate), f"./md_outputs/{candidate}"
+        except FileNotFoundError:
+            continue
+    
+    return None, None
+
+def read_document(file_path: str, full_path: Path, doc_dir: Path, md_names: set = None) -> tuple:
+    """Get the text to summarize for a file
+    
+    Images, PDFs and DOCX files use their md_outputs/ conversion when there
+    is one; everything else is read directly.
+    
+    Returns:
+        Tuple of (content, text_conversion_path, conversion_type), where the
+        last two are None when the file was read directly
+    """
+    file_ext = full_path.suffix.lower()
+    
+    if file_ext in IMAGE_EXTS or file_ext in DOC_EXTS:
+        content, text_conversion_path = find_text_conversion(file_path, doc_dir, md_names)
+        if content:
+            if file_ext in IMAGE_EXTS:
+                conversion_type = "OCR text"
+            elif file_ext == '.pdf':
+                conversion_type = "PDF markdown"
+            else:
+                conversion_type = "DOCX markdown"
+            return content, text_conversion_path, conversion_type
+    
+    # If no text conversion, read file content normally
+    return read_file_content(full_path), None, None
+
+def save_pending(pending_path: Path, summaries: list):
+    """Write .dms_pending_summaries.json atomically (temp file, then rename)"""
+    pending_data = {
+        "timestamp": datetime.now().isoformat(),
+        "summaries": summaries
+    }
+    tmp_path = pending_path.parent / f"{pending_path.name}.tmp"
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(pending_data, option=orjson.OPT_INDENT_2))
+    else:
+        tmp_path.write_text(json.dumps(pending_data, indent=2), encoding='utf-8')
+    os.replace(tmp_path, pending_path)
+
+def load_cache(cache_path: Path) -> dict:
+    """Load .dms_summary_cache.json (summary key -> Ollama result)"""
+    if not cache_path.exists():
+        return {}
+    try:
+        return read_json(cache_path)
+    except Exception:
+        return {}
+
+def save_cache(cache_path: Path, cache: dict):
+    """Write .dms_summary_cache.json atomically (temp file, then rename)"""
+    tmp_path = cache_path.parent / f"{cache_path.name}.tmp"
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(cache))
+    else:
+        tmp_path.write_text(json.dumps(cache), encoding='utf-8')
+    os.replace(tmp_path, cache_path)
+
+def summary_cache_key(model: str, file_name: str, content: str, categories: list) -> str:
+    """Cache key covering every input to the summary prompt"""
+    key_text = '\0'.join((model, file_name, content, '|'.join(sorted(categories))))
+    return hashlib.sha256(key_text.encode('utf-8', errors='replace')).hexdigest()
 
 def check_ollama(host: str, model: str) -> bool:
     """Check if Ollama is running and model available"""
     try:
-        resp = requests.get(f"{host}/api/tags", timeout=5)
+        resp = _SESSION.get(f"{host}/api/tags", timeout=5)
         if resp.status_code != 200:
             return False
         tags = resp.json().get('models', [])
@@ -105,7 +277,7 @@ def preload_ollama_model(host: str, model: str) -> bool:
     into memory. Prevents timeouts on the first actual summarization request.
     """
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             f"{host}/api/generate",
             json={
                 "model": model,
@@ -132,26 +304,21 @@ def preload_ollama_model(host: str, model: str) -> bool:
         print(f"  ⚠ Continuing anyway...", file=sys.stderr)
         return False
 
-def generate_summary_and_category(file_content: str, file_name: str, existing_categories: list, config: dict, is_first: bool = False) -> dict:
-    """Call Ollama to generate both summary AND category suggestion with retry logic
+def retry_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Seconds to wait before retry number `attempt` (1-based)
     
-    Args:
-        is_first: If True, use extended timeout (600s) for first request after preload
+    Exponential backoff with jitter: concurrent workers that failed
+    together spread their retries out instead of hitting an overloaded
+    server again at the same moment.
     """
-    max_retries = 3
-    retry_delay = 2  # seconds
-    
-    # First request gets longer timeout to allow model startup
-    first_attempt_timeout = 600 if is_first else 300
-    
+    return min(cap, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+@lru_cache(maxsize=8)
+def prompt_prefix(existing_categories: tuple) -> str:
+    """The part of the summary prompt that is the same for every file"""
     categories_str = ", ".join(existing_categories) if existing_categories else "Guides, Models, Scripts, Workflows, QuickRefs"
     
-    prompt = f"""Analyze this document and provide a summary and category assignment.
-
-Filename: {file_name}
-
-Document content:
-{file_content}
+    return f"""Analyze the document below and provide a summary and category assignment.
 
 Task:
 1. Write a brief technical summary (1-2 sentences, max 50 words) describing what this document contains and its purpose.
@@ -159,27 +326,72 @@ Task:
    - Only propose a NEW category if none of the existing categories are appropriate.
    - New categories should be justified and follow the naming pattern of existing ones.
 
-Respond ONLY with valid JSON in this exact format:
+Respond with JSON in this format:
 {{
   "summary": "your concise technical summary here (max 50 words)",
   "category": "chosen category name",
   "is_new_category": false
 }}
 
-If proposing a new category, set is_new_category to true."""
+If proposing a new category, set is_new_category to true.
+"""
+
+_JSON_DECODER = json.JSONDecoder()
+
+def parse_json_reply(text: str) -> dict:
+    """Parse the model's JSON reply
+    
+    JSON mode returns a bare object. If a server ignores "format" and wraps
+    the object in prose or a code fence, decode from the first "{" instead
+    (raw_decode stops at the end of that object, so no splitting or regex
+    is needed).
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        start = text.find('{')
+        if start < 0:
+            raise
+        return _JSON_DECODER.raw_decode(text, start)[0]
+
+def generate_summary_and_category(file_content: str, file_name: str, existing_categories: list, config: dict, is_first: bool = False, host: str = None) -> dict:
+    """Call Ollama to generate both summary AND category suggestion with retry logic
+    
+    Args:
+        is_first: If True, use extended timeout (600s) for first request after preload
+        host: Ollama server to use (default: config['ollama_host'])
+    """
+    host = host or config['ollama_host']
+    max_retries = 3
+    
+    # First request gets longer timeout to allow model startup
+    first_attempt_timeout = 600 if is_first else 300
+    
+    # Shared instructions first, the file last: every request then starts
+    # with the same tokens, which Ollama reuses from its KV cache instead
+    # of re-processing them for each file
+    prompt = f"""{prompt_prefix(tuple(existing_categories))}
+Filename: {file_name}
+
+Document content:
+{file_content}"""
     
     for attempt in range(1, max_retries + 1):
         try:
             # Use extended timeout on first attempt, normal on retries
             timeout = first_attempt_timeout if attempt == 1 else 300
             
-            resp = requests.post(
-                f"{config['ollama_host']}/api/generate",
+            resp = _SESSION.post(
+                f"{host}/api/generate",
                 json={
                     "model": config['ollama_model'],
                     "prompt": prompt,
-                    "temperature": 0.2,
-                    "stream": False
+                    # Grammar-constrained JSON: no code fences or prose to
+                    # strip, and no retries for unparseable replies
+                    "format": "json",
+                    "stream": False,
+                    # The reply is one short JSON object, so cap its length
+                    "options": {"temperature": 0.2, "num_predict": 200}
                 },
                 timeout=timeout
             )
@@ -188,23 +400,13 @@ If proposing a new category, set is_new_category to true."""
                 error_msg = resp.text[:100] if resp.text else f"HTTP {resp.status_code}"
                 if attempt < max_retries:
                     print(f"  ⚠ Ollama error (attempt {attempt}/{max_retries}): {error_msg}. Retrying...", file=sys.stderr)
-                    import time
-                    time.sleep(retry_delay)
+                    time.sleep(retry_delay(attempt))
                     continue
                 else:
                     print(f"  ✗ Ollama failed after {max_retries} attempts: {error_msg}", file=sys.stderr)
                     return {"error": True}
             
-            response_text = resp.json().get('response', '').strip()
-            
-            # Try to parse JSON from response
-            json_text = response_text
-            if '```json' in response_text:
-                json_text = response_text.split('```json')[1].split('```')[0].strip()
-            elif '```' in response_text:
-                json_text = response_text.split('```')[1].split('```')[0].strip()
-            
-            parsed = json.loads(json_text)
+            parsed = parse_json_reply(resp.json().get('response', ''))
             
             return {
                 "summary": parsed.get('summary', '').strip(),
@@ -216,23 +418,21 @@ If proposing a new category, set is_new_category to true."""
         except requests.exceptions.Timeout:
             if attempt < max_retries:
                 print(f"  ⚠ Ollama timeout (attempt {attempt}/{max_retries}). Retrying...", file=sys.stderr)
-                import time
-                time.sleep(retry_delay)
+                time.sleep(retry_delay(attempt))
                 continue
             else:
                 print(f"  ✗ Ollama timeout after {max_retries} attempts", file=sys.stderr)
                 return {"error": True}
         
         except requests.exceptions.ConnectionError:
-            print(f"  ✗ Cannot connect to Ollama at {config['ollama_host']}", file=sys.stderr)
-            return {"error": True}
+            print(f"  ✗ Cannot connect to Ollama at {host}", file=sys.stderr)
+            return {"error": True, "connection_error": True}
         
         except json.JSONDecodeError as e:
             print(f"  ⚠ Failed to parse Ollama response as JSON: {e}", file=sys.stderr)
             if attempt < max_retries:
                 print(f"  ⚠ Retrying (attempt {attempt}/{max_retries})...", file=sys.stderr)
-                import time
-                time.sleep(retry_delay)
+                time.sleep(retry_delay(attempt))
                 continue
             else:
                 return {"error": True}
@@ -240,14 +440,64 @@ If proposing a new category, set is_new_category to true."""
         except Exception as e:
             print(f"  ✗ Ollama error (attempt {attempt}/{max_retries}): {e}", file=sys.stderr)
             if attempt < max_retries:
-                import time
-                time.sleep(retry_delay)
+                time.sleep(retry_delay(attempt))
                 continue
             else:
                 return {"error": True}
     
     return {"error": True}
 
+class OllamaHostPool:
+    """Dispatch summary requests round-robin across several Ollama hosts
+    
+    Each host takes up to `concurrency` requests at a time; a request goes
+    to the next host with a free slot, or waits on the next one in turn.
+    A host that cannot be reached is skipped for QUARANTINE_SECONDS and
+    the request is retried on another host.
+    """
+    QUARANTINE_SECONDS = 60
+    
+    def __init__(self, hosts: list, concurrency: int):
+        self.hosts = list(hosts)
+        self._slots = {host: threading.Semaphore(concurrency) for host in self.hosts}
+        self._down_until = {host: 0.0 for host in self.hosts}
+        self._next = 0  # index of the host the next request tries first
+        self._lock = threading.Lock()
+    
+    def _acquire(self, skip: set):
+        """Take a slot on a healthy host not in skip; None if there is none"""
+        with self._lock:
+            now = time.monotonic()
+            start = self._next
+            self._next = (start + 1) % len(self.hosts)
+            candidates = self.hosts[start:] + self.hosts[:start]
+            candidates = [h for h in candidates if h not in skip and self._down_until[h] <= now]
+        if not candidates:
+            return None
+        for host in candidates:
+            if self._slots[host].acquire(blocking=False):
+                return host
+        self._slots[candidates[0]].acquire()
+        return candidates[0]
+    
+    def summarize(self, *args, **kwargs) -> dict:
+        """generate_summary_and_category on the next available host"""
+        tried = set()
+        while True:
+            host = self._acquire(tried)
+            if host is None:
+                return {"error": True}
+            try:
+                result = generate_summary_and_category(*args, host=host, **kwargs)
+            finally:
+                self._slots[host].release()
+            if not result.get('connection_error') or len(self.hosts) == 1:
+                return result
+            tried.add(host)
+            with self._lock:
+                self._down_until[host] = time.monotonic() + self.QUARANTINE_SECONDS
+            print(f"  ⚠ {host} unreachable, retrying on another host", file=sys.stderr)
+
 def truncate_summary(summary: str, max_words: int = 50) -> tuple:
     """Truncate summary to max_words and return (summary, was_truncated)"""
     words = summary.split()
@@ -257,8 +507,24 @@ def truncate_summary(summary: str, max_words: int = 50) -> tuple:
     truncated = ' '.join(words[:max_words]) + '…'
     return truncated, True
 
-def find_image_for_text_file(text_file_path: str, doc_dir: Path) -> str:
-    """Find the original image file for a text file created by OCR"""
+def list_doc_names(doc_dir: Path) -> set:
+    """Names of the entries directly in Doc/ (one scandir)"""
+    with os.scandir(doc_dir) as entries:
+        return {entry.name for entry in entries}
+
+def list_md_names(doc_dir: Path) -> set:
+    """Names of the conversions in Doc/md_outputs/ (empty if there is none)"""
+    try:
+        return list_doc_names(doc_dir / "md_outputs")
+    except FileNotFoundError:
+        return set()
+
+def find_image_for_text_file(text_file_path: str, doc_dir: Path, doc_names: set = None) -> str:
+    """Find the original image file for a text file created by OCR
+    
+    doc_names, from list_doc_names(), lets a caller matching many text
+    files look each candidate up in memory instead of probing the disk.
+    """
     # text_file format: ./md_outputs/IMG_4666.jpeg.txt or ./md_outputs/IMG_4666 copy.txt
     # original image: ./IMG_4666.jpeg or ./IMG_4666 copy.jpeg
     
@@ -270,17 +536,17 @@ def find_image_for_text_file(text_file_path: str, doc_dir: Path) -> str:
     # Remove .txt to get the potential original name
     without_txt = text_name[:-4]  # e.g., "IMG_4666.jpeg" or "IMG_4666 copy"
     
+    if doc_names is None:
+        doc_names = list_doc_names(doc_dir)
+    
     # Try exact match first (for IMG_4666.jpeg.txt -> IMG_4666.jpeg)
-    potential_path = doc_dir / without_txt
-    if potential_path.exists():
+    if without_txt in doc_names:
         return f"./{without_txt}"
     
     # If that didn't work, look for files that start with this name
     # (for IMG_4666 copy.txt -> IMG_4666 copy.jpeg)
-    image_exts = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp'}
-    for ext in image_exts:
-        potential_path = doc_dir / (without_txt + ext)
-        if potential_path.exists():
+    for ext in ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp'):
+        if without_txt + ext in doc_names:
             return f"./{without_txt + ext}"
     
     return None
@@ -289,13 +555,16 @@ def main():
     parser = argparse.ArgumentParser(description="Generate AI summaries for new files")
     parser.add_argument("--doc", default="Doc", help="Doc directory")
     parser.add_argument("--model", help="Override Ollama model")
+    parser.add_argument("--concurrency", type=int, help="Ollama requests in flight per host (default: ollama_concurrency in config, else 4)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would happen, don't write")
+    parser.add_argument("--no-cache", action="store_true", help="Ask Ollama even for cached files (fresh results still update the cache)")
     args = parser.parse_args()
     
     doc_dir = Path(args.doc)
     scan_path = doc_dir / ".dms_scan.json"
     state_path = doc_dir / ".dms_state.json"
     pending_path = doc_dir / ".dms_pending_summaries.json"
+    cache_path = doc_dir / ".dms_summary_cache.json"
     
     if not doc_dir.exists():
         print(f"ERROR: {doc_dir} not found")
@@ -305,28 +574,40 @@ def main():
     config = load_config()
     if args.model:
         config['ollama_model'] = args.model
+    if args.concurrency:
+        config['ollama_concurrency'] = args.concurrency
     
     print("==> Generating AI summaries...\n")
     print(f"Using model: {config['ollama_model']}")
-    print(f"Ollama host: {config['ollama_host']}\n")
-    
-    # Check Ollama is available
-    if not check_ollama(config['ollama_host'], config['ollama_model']):
-        print(f"ERROR: Cannot connect to Ollama at {config['ollama_host']}")
+    hosts = config.get('ollama_hosts') or [config['ollama_host']]
+    print(f"Ollama host: {', '.join(hosts)}\n")
+    # ollama_concurrency requests in flight per host
+    concurrency = max(1, int(config.get('ollama_concurrency', 4)))
+    size_session(len(hosts), concurrency)
+    
+    # Check Ollama is available (all hosts at once); unreachable hosts are
+    # left out of this run
+    with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+        available = list(executor.map(lambda h: check_ollama(h, config['ollama_model']), hosts))
+    hosts = [host for host, ok in zip(hosts, available) if ok]
+    if not hosts:
+        print(f"ERROR: Cannot connect to Ollama at {config.get('ollama_hosts') or config['ollama_host']}")
         print(f"Make sure Ollama is running (ollama serve)")
         return 1
     
     # Preload model to avoid slow first request
-    print("\n✓ Ollama is running")
+    print(f"\n✓ Ollama is running ({len(hosts)} host(s))")
     print("\nPreloading model (this may take a moment on first run)...")
-    preload_ollama_model(config['ollama_host'], config['ollama_model'])
+    with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+        list(executor.map(lambda h: preload_ollama_model(h, config['ollama_model']), hosts))
     print()
     
     # Load state to get existing categories
     state = load_state(state_path)
     all_categories = state.get('categories', [])
-    # Filter out categories starting with ARCHIVE
-    existing_categories = [cat for cat in all_categories if not cat.startswith('ARCHIVE')]
+    # Filter out categories starting with ARCHIVE. A tuple: it is fixed for
+    # the run, and as-is it keys the cached prompt_prefix() on every call
+    existing_categories = tuple(cat for cat in all_categories if not cat.startswith('ARCHIVE'))
     
     if all_categories and existing_categories:
         filtered_out = len(all_categories) - len(existing_categories)
@@ -349,7 +630,7 @@ def main():
     if pending_path.exists():
         print(f"Found partial progress in {pending_path}")
         try:
-            existing = json.loads(pending_path.read_text(encoding='utf-8'))
+            existing = read_json(pending_path)
             already_done = {s['file']['path'] for s in existing.get('summaries', [])}
             print(f"✓ {len(already_done)} already summarized, resuming from there\n")
             summaries = existing.get('summaries', [])
@@ -363,64 +644,91 @@ def main():
     
     print(f"Summarizing {len(files_to_process)}/{len(files_to_summarize)} file(s)...\n")
     
-    for i, file_info in enumerate(files_to_process, 1):
+    md_names = list_md_names(doc_dir)  # one listing instead of a probe per candidate
+    
+    def read_job(file_info):
+        """Everything a file's Ollama request needs, or None if it is gone"""
         file_path = file_info.get('path', '')
         full_path = doc_dir / file_path.lstrip('./')
-        
-        print(f"[{len(already_done) + i}/{len(files_to_summarize)}] {Path(file_path).name}")
-        
         if not full_path.exists():
-            print(f"  ⚠ File not found\n")
-            continue
-        
-        # Check if this is an image, PDF, or DOCX and we have a text conversion
-        content = None
-        text_conversion_path = None
-        file_ext = full_path.suffix.lower()
+            return file_path, None
+        content, text_conversion_path, conversion_type = read_document(file_path, full_path, doc_dir, md_names)
+        cache_key = summary_cache_key(config['ollama_model'], Path(file_path).name, content, existing_categories)
+        return file_path, (file_info, file_path, content, text_conversion_path, conversion_type, cache_key)
+    
+    # Results from earlier runs, keyed on model, file name, content and
+    # categories: a file that was already summarized with the same inputs
+    # costs no Ollama call (e.g. re-running summarize after a new scan)
+    cache = load_cache(cache_path)
+    cache_hits = 0
+    
+    # concurrency requests in flight per host. The server works on several
+    # requests at once (OLLAMA_NUM_PARALLEL), so wall time is no longer the
+    # sum of every request's latency.
+    pool = OllamaHostPool(hosts, concurrency)
+    workers = concurrency * len(hosts)
+    jobs = []
+    done = len(already_done)
+    new_summaries = {}  # position in jobs -> summary, so the saved order is stable
+    doc_names = None  # Doc/ listing, read on first use by find_image_for_text_file
+    
+    # Files are read on a separate pool (a stat or open on a OneDrive
+    # placeholder can block while it downloads) and each one's request is
+    # submitted as soon as its content is in, so reading overlaps inference
+    with ThreadPoolExecutor(max_workers=workers) as executor, \
+         ThreadPoolExecutor(max_workers=READ_WORKERS) as reader:
+        futures = {}
+        submitted = 0
+        for file_path, job in reader.map(read_job, files_to_process):
+            if job is None:
+                print(f"{Path(file_path).name}")
+                print(f"  ⚠ File not found\n")
+                continue
+            n = len(jobs)
+            jobs.append(job)
+            _, _, content, _, _, cache_key = job
+            cached = None if args.no_cache else cache.get(cache_key)
+            if cached is not None:
+                future = Future()
+                future.set_result(dict(cached, error=False, cached=True))
+                futures[future] = n
+                continue
+            # The first wave may queue behind the model load, so when not
+            # resuming it gets the extended first-request timeout
+            is_first = not already_done and submitted < workers
+            submitted += 1
+            future = executor.submit(pool.summarize, content, Path(file_path).name,
+                                     existing_categories, config, is_first=is_first)
+            futures[future] = n
+        total = len(already_done) + len(jobs)
         
-        if file_ext in {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.pdf', '.docx', '.doc'}:
-            converted_text = find_text_conversion(file_path, doc_dir)
-            if converted_text:
-                content = converted_text
-                # Try to find which text/markdown file was actually used
-                file_stem = full_path.stem
-                
-                # For images: look for .txt
-                if file_ext in {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}:
-                    text_file_stem = doc_dir / "md_outputs" / (file_stem + ".txt")
-                    text_file_full = doc_dir / "md_outputs" / (full_path.name + ".txt")
-                    
-                    if text_file_stem.exists():
-                        text_conversion_path = f"./md_outputs/{file_stem}.txt"
-                    elif text_file_full.exists():
-                        text_conversion_path = f"./md_outputs/{full_path.name}.txt"
-                    
-                    conversion_type = "OCR text"
-                
-                # For PDFs and DOCX: look for .md
-                elif file_ext in {'.pdf', '.docx', '.doc'}:
-                    md_file = doc_dir / "md_outputs" / (file_stem + ".md")
-                    
-                    if md_file.exists():
-                        text_conversion_path = f"./md_outputs/{file_stem}.md"
-                    
-                    if file_ext == '.pdf':
-                        conversion_type = "PDF markdown"
-                    else:
-                        conversion_type = "DOCX markdown"
-                
+        for future in as_completed(futures):
+            n = futures[future]
+            file_info, file_path, _, text_conversion_path, conversion_type, cache_key = jobs[n]
+            result = future.result()
+            done += 1
+            
+            print(f"[{done}/{total}] {Path(file_path).name}")
+            if conversion_type:
                 print(f"  ℹ Using {conversion_type} conversion")
-        
-        # If no text conversion, read file content normally
-        if content is None:
-            content = read_file_content(full_path)
-        
-        # Generate summary AND get category suggestion
-        # Pass is_first=True only for the first file (to use extended timeout)
-        is_first_file = (len(already_done) + i == 1)
-        result = generate_summary_and_category(content, Path(file_path).name, existing_categories, config, is_first=is_first_file)
-        
-        if result and not result.get('error'):
+            
+            if text_conversion_path is None and Path(file_path).suffix.lower() in BINARY_EXTS:
+                print(f"  ℹ Binary file with no text conversion, categorized by name only")
+            
+            if result and result.get('cached'):
+                cache_hits += 1
+                print(f"  ✓ Cached result (no Ollama call)")
+            elif result and not result.get('error'):
+                cache[cache_key] = {
+                    "summary": result['summary'],
+                    "category": result['category'],
+                    "is_new_category": result['is_new_category']
+                }
+            
+            if not result or result.get('error'):
+                print(f"  ✗ Failed to generate summary\n")
+                continue
+            
             summary = result['summary']
             category = result['category']
             is_new_cat = result['is_new_category']
@@ -444,38 +752,47 @@ def main():
                 "hash": file_info.get('hash', ''),
                 "size": file_info.get('size', 0)
             }
+            for key in ('file_mtime_ns', 'dev', 'ino'):
+                if key in file_info:
+                    file_entry[key] = file_info[key]
             
             # If we used a text conversion for an image, record that
             if text_conversion_path:
                 file_entry['readable_version'] = text_conversion_path
             # If this is a text file in md_outputs, check for original image
             elif './md_outputs/' in file_path and file_path.endswith('.txt'):
-                image_path = find_image_for_text_file(file_path, doc_dir)
+                if doc_names is None:
+                    doc_names = list_doc_names(doc_dir)
+                image_path = find_image_for_text_file(file_path, doc_dir, doc_names)
                 if image_path:
                     file_entry['readable_version'] = image_path
             
-            summaries.append({
+            new_summaries[n] = {
                 "file": file_entry,
                 "summary": truncated_summary,
                 "category": category,
                 "is_new_category": is_new_cat,
                 "title": Path(file_path).stem,
                 "timestamp": datetime.now().isoformat()
-            })
-        else:
-            print(f"  ✗ Failed to generate summary\n")
+            }
+            
+            # Save progress after every completion, so an interrupted run
+            # resumes without redoing finished files
+            if not args.dry_run:
+                save_pending(pending_path, summaries + [new_summaries[k] for k in sorted(new_summaries)])
+    
+    summaries += [new_summaries[k] for k in sorted(new_summaries)]
+    
+    if cache_hits:
+        print(f"✓ {cache_hits} summary/summaries reused from {cache_path.name}")
     
     if args.dry_run:
         print(f"DRY RUN: Would save {len(summaries)} summary/summaries")
         return 0
     
     # Save pending summaries
-    pending_data = {
-        "timestamp": datetime.now().isoformat(),
-        "summaries": summaries
-    }
-    
-    pending_path.write_text(json.dumps(pending_data, indent=2), encoding='utf-8')
+    save_pending(pending_path, summaries)
+    save_cache(cache_path, cache)
     
     print(f"\n✓ Generated {len(summaries)} summary/summaries")
     print(f"✓ Saved to {pending_path}")